@@ -1,111 +1,190 @@
 import streamlit as st
 import sys
+import json
+import logging
+from functools import lru_cache, partial
 from pathlib import Path
 
 # Add parent directory to path to import tools
-sys.path.append(str(Path(__file__).parent.parent))
+parent_dir = str(Path(__file__).resolve().parent.parent)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
 from tools.user_preferences import UserPreferences
 
+logger = logging.getLogger(__name__)
+
+# Default confidence threshold for newly detected preferences
+DEFAULT_THRESHOLD = 80
+
+def _get_prefs():
+    """Build the UserPreferences instance once per session; it holds that user's threshold"""
+    if "user_preferences" not in st.session_state:
+        st.session_state.user_preferences = UserPreferences(confidence_threshold=DEFAULT_THRESHOLD)
+    return st.session_state.user_preferences
+
+# Every button on this page spans the full container width
+button = partial(st.button, use_container_width=True)
+
+# Session state defaults for the preferences page; list values are copied per session
+SESSION_DEFAULTS = {
+    "show_preference_confirmation": False,
+    "detected_preferences": None,
+    "suggested_prompt": "",
+    "debug_info": [],
+    "show_debug": False,
+    "show_current_prefs_result": False,
+    "current_preferences": [],
+}
+
+# Styles for the confirmation dialog
+DIALOG_CSS = """
+<style>
+.preference-dialog {
+    background-color: #f0f2f6;
+    border-radius: 10px;
+    padding: 20px;
+    margin: 20px 0;
+    border-left: 5px solid #2196F3;
+    box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+}
+</style>
+"""
+
+@st.cache_data(show_spinner=False)
+def _load_prefs_cached(path, mtime):
+    """Parse the preferences file; keyed on mtime so it is only re-read after the file changes"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+@st.cache_data(show_spinner=False)
+def _format_prefs(prefs_dict):
+    """Flatten a preferences dict into display rows"""
+    return [{"name": name, "value": details["value"], "description": details.get("explanation", "")}
+            for name, details in prefs_dict.items()]
+
+# The dialog strings repeat across reruns while it is open, so format each once
+@lru_cache(maxsize=64)
+def _fmt_bold(msg):
+    return f"**{msg}**"
+
+@lru_cache(maxsize=16)
+def _fmt_high_heading(threshold):
+    return f"### High Confidence Preferences (≥{threshold}%):"
+
+@lru_cache(maxsize=16)
+def _fmt_no_high(threshold):
+    return f"No preferences with confidence ≥{threshold}% detected. Please try being more specific."
+
+def _cell(value):
+    """Make a value safe to place inside a markdown table cell"""
+    return str(value).replace("|", "\\|").replace("\n", " ")
+
+def _prefs_table(prefs):
+    """Render detected preferences as a single markdown table"""
+    lines = ["| Name | Value | Confidence | Explanation |", "|---|---|---|---|"]
+    lines += [f"| **{_cell(name)}** | {_cell(d['value'])} | {d['confidence']}% | {_cell(d.get('explanation', ''))} |"
+              for name, d in prefs.items()]
+    return "\n".join(lines)
+
+# Page styles for standalone runs; buttons already span the container and the dialog has DIALOG_CSS
+STANDALONE_CSS = """
+<style>
+.stTextArea textarea {
+    border-radius: 5px;
+    border: 1px solid #ddd;
+}
+.stAlert {
+    border-radius: 5px;
+}
+h1, h2, h3 {
+    color: #2196F3;
+}
+.stMarkdown h3 {
+    margin-top: 20px;
+}
+</style>
+"""
+
 class PreferencesApp:
-    def __init__(self):
-        """Initialize the AI Preferences Management application"""
-        # Initialize preferences with a configurable confidence threshold
-        default_threshold = 80
-        self.preferences = UserPreferences(confidence_threshold=default_threshold)
+    @property
+    def preferences(self):
+        """This session's preferences; the app object itself may be shared across sessions"""
+        return _get_prefs()
         
+    def _saved_preferences(self):
+        """Return the saved preferences, falling back to the in-memory copy if the file is unreadable"""
+        path = self.preferences.preferences_file
+        try:
+            return _load_prefs_cached(str(path), path.stat().st_mtime)
+        except (OSError, json.JSONDecodeError):
+            return self.preferences.preferences
+    
+    # Button callbacks apply all state changes before the single rerun Streamlit
+    # already does for a click, so no extra st.rerun() is needed
+    def _reset_confirmation_cb(self):
+        st.session_state.show_preference_confirmation = False
+        st.session_state.pop('detected_split_key', None)
+        st.session_state.detected_preferences = None
+        st.session_state.suggested_prompt = ""
+    
+    def _save_prefs_cb(self, high_confidence_prefs):
+        saved = self.preferences.save_identified_preferences({"identified_preferences": high_confidence_prefs})
+        _load_prefs_cached.clear()
+        st.toast(f"Saved {len(saved)} preferences successfully!", icon="✅")
+        self._reset_confirmation_cb()
+    
+    def _hide_prefs_cb(self):
+        st.session_state.show_current_prefs_result = False
+    
+    def _split_detected(self, threshold):
+        """Partition the detected preferences and build their tables, reusing the result until they change"""
+        detected = st.session_state.detected_preferences
+        cache_key = (id(detected), threshold)
+        if st.session_state.get('detected_split_key') != cache_key:
+            high, low = {}, {}
+            for name, details in detected.items():
+                if details['confidence'] >= threshold:
+                    high[name] = details
+                else:
+                    low[name] = details
+            st.session_state.detected_split = (high, low, _prefs_table(high), _prefs_table(low))
+            st.session_state.detected_split_key = cache_key
+        return st.session_state.detected_split
+    
     def render(self):
         """Render the AI Preferences Management interface"""
         # Session state variables
-        if 'show_preference_confirmation' not in st.session_state:
-            st.session_state.show_preference_confirmation = False
-        if 'detected_preferences' not in st.session_state:
-            st.session_state.detected_preferences = None
-        if 'suggested_prompt' not in st.session_state:
-            st.session_state.suggested_prompt = ""
-        if 'debug_info' not in st.session_state:
-            st.session_state.debug_info = []
-        if 'show_debug' not in st.session_state:
-            st.session_state.show_debug = False
-
-        if 'show_success_popup' not in st.session_state:
-            st.session_state.show_success_popup = False
-        if 'success_message' not in st.session_state:
-            st.session_state.success_message = ""
-
-        if 'show_current_prefs_result' not in st.session_state:
-            st.session_state.show_current_prefs_result = False
-        if 'current_preferences' not in st.session_state:
-            st.session_state.current_preferences = []
+        for key, value in SESSION_DEFAULTS.items():
+            if key not in st.session_state:
+                st.session_state[key] = list(value) if isinstance(value, list) else value
+        
+        # Emitted every run; Streamlit removes elements that a rerun does not emit again
+        st.markdown(DIALOG_CSS, unsafe_allow_html=True)
             
         confidence_threshold = self.preferences.confidence_threshold
             
-        # Success pop-up
-        if st.session_state.show_success_popup:
-            st.markdown("""
-            <style>
-            .success-dialog {
-                background-color: #e8f5e9;
-                border-radius: 10px;
-                padding: 20px;
-                margin: 20px 0;
-                border-left: 5px solid #4CAF50;
-                box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-            }
-            </style>
-            """, unsafe_allow_html=True)
-            
-            with st.container():
-                st.markdown('<div class="success-dialog">', unsafe_allow_html=True)
-                st.markdown("### ✅ Success!")
-                st.markdown(f"**{st.session_state.success_message}**")
-                
-                if st.button("Dismiss", key="dismiss_success", use_container_width=True):
-                    st.session_state.show_success_popup = False
-                    st.session_state.success_message = ""
-                    st.rerun()
-                
-                st.markdown('</div>', unsafe_allow_html=True)
-            
-        # High-confidence preferences and confirmation dialog
+        # High-confidence preferences and confirmation dialog, held in one placeholder slot
+        dialog = st.empty()
         if st.session_state.show_preference_confirmation and st.session_state.detected_preferences:
-            st.markdown("""
-            <style>
-            .preference-dialog {
-                background-color: #f0f2f6;
-                border-radius: 10px;
-                padding: 20px;
-                margin: 20px 0;
-                border-left: 5px solid #2196F3;
-                box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-            }
-            </style>
-            """, unsafe_allow_html=True)
-            
-            with st.container():
+            with dialog.container():
                 st.markdown('<div class="preference-dialog">', unsafe_allow_html=True)
                 st.markdown("### 🔔 New Preferences Detected!")
-                st.markdown(f"**{st.session_state.suggested_prompt}**")
+                st.markdown(_fmt_bold(st.session_state.suggested_prompt))
                 st.markdown("---")
                 
                 # Only show llm fetchedpreferences with confidence >= threshold
-                high_confidence_prefs = {name: details for name, details in st.session_state.detected_preferences.items() 
-                                        if details['confidence'] >= confidence_threshold}
+                high_confidence_prefs, low_confidence_prefs, high_table, low_table = self._split_detected(confidence_threshold)
                 
                 if high_confidence_prefs:
-                    st.markdown(f"### High Confidence Preferences (≥{confidence_threshold}%):")
-                    for name, details in high_confidence_prefs.items():
-                        st.info(f"**{name}**: {details['value']} (Confidence: {details['confidence']}%)\n\n{details['explanation']}")
+                    st.markdown(_fmt_high_heading(confidence_threshold))
+                    st.markdown(high_table)
                 else:
-                    st.info(f"No preferences with confidence ≥{confidence_threshold}% detected. Please try being more specific.")
+                    st.info(_fmt_no_high(confidence_threshold))
                     
                 # Only show low confidence preferences if there are high confidence ones too
-                if high_confidence_prefs:
-                    low_confidence_prefs = {name: details for name, details in st.session_state.detected_preferences.items() 
-                                          if details['confidence'] < confidence_threshold}
-                    if low_confidence_prefs:
-                        st.markdown("### Lower Confidence Preferences:")
-                        for name, details in low_confidence_prefs.items():
-                            st.warning(f"**{name}**: {details['value']} (Confidence: {details['confidence']}%)\n\n{details['explanation']}")
+                if high_confidence_prefs and low_confidence_prefs:
+                    st.markdown("### Lower Confidence Preferences:")
+                    st.markdown(low_table)
                 
                 # Only show confirmation if there are high confidence preferences
                 if high_confidence_prefs:
@@ -115,26 +194,24 @@ class PreferencesApp:
                     # Use columns for the buttons
                     col1, col2 = st.columns([1, 1])
                     with col1:
-                        if st.button("✅ Save Preferences", use_container_width=True, disabled=not confirmation):
-                            if confirmation:
-                                saved = self.preferences.save_identified_preferences({"identified_preferences": high_confidence_prefs})
-                                st.session_state.success_message = f"Saved {len(saved)} preferences successfully!"
-                                st.session_state.show_success_popup = True
-                                st.session_state.show_preference_confirmation = False
-                                st.session_state.detected_preferences = None
-                                st.session_state.suggested_prompt = ""
-                                st.rerun()
+                        button("✅ Save Preferences", key="save_prefs_btn", disabled=not confirmation,
+                               on_click=self._save_prefs_cb, args=(high_confidence_prefs,))
                     
                     with col2:
-                        if st.button("❌ Cancel", use_container_width=True):
-                            # Reset the state
-                            st.session_state.show_preference_confirmation = False
-                            st.session_state.detected_preferences = None
-                            st.session_state.suggested_prompt = ""
-                            st.rerun()
+                        button("❌ Cancel", key="cancel_prefs_btn",
+                               on_click=self._reset_confirmation_cb)
                 
                 st.markdown('</div>', unsafe_allow_html=True)
         
+        self._pref_management_fragment()
+    
+    # Slider, current-preferences view and request box rerun on their own;
+    # opening the confirmation dialog uses an app-scoped st.rerun() so it appears above
+    @st.fragment
+    def _pref_management_fragment(self):
+        """Render the preference management controls"""
+        confidence_threshold = self.preferences.confidence_threshold
+        
         # AI pref management section
         st.markdown("### AI Preference Management")
         
@@ -145,6 +222,7 @@ class PreferencesApp:
             max_value=95, 
             value=confidence_threshold,
             step=5,
+            key="confidence_threshold_slider",
             help="Set the minimum confidence level required for preferences to be automatically applied."
         )
         
@@ -152,27 +230,16 @@ class PreferencesApp:
             self.preferences.confidence_threshold = new_threshold
             st.success(f"Confidence threshold updated to {new_threshold}%")
         
-        if st.button("Show Current Preferences", key="show_current_prefs", use_container_width=True):
+        if button("Show Current Preferences", key="show_current_prefs"):
             with st.spinner("Loading current preferences..."):
                 try:
-                    all_preferences = self.preferences.preferences
+                    all_preferences = self._saved_preferences()
                     if all_preferences and "preferences" in all_preferences:
                         current_prefs = all_preferences["preferences"]
                         if current_prefs and len(current_prefs) > 0:
-                            # Format the preferences for display
-                            formatted_prefs = []
-                            for name, details in current_prefs.items():
-                                formatted_prefs.append({
-                                    "name": name,
-                                    "value": details["value"],
-                                    "description": details.get("explanation", "")
-                                })
-                            
-                            st.session_state.current_preferences = formatted_prefs
+                            st.session_state.current_preferences = _format_prefs(current_prefs)
                             st.session_state.show_current_prefs_result = True
-                            st.session_state.success_message = "Successfully retrieved your current preferences."
-                            st.session_state.show_success_popup = True
-                            st.rerun()
+                            st.toast("Successfully retrieved your current preferences.", icon="✅")
                         else:
                             st.info("You don't have any saved preferences yet.")
                     else:
@@ -187,12 +254,9 @@ class PreferencesApp:
                 if not current_prefs:
                     st.info("No preferences found.")
                 else:
-                    for pref in current_prefs:
-                        st.info(f"**{pref['name']}**: {pref['value']}" + 
-                               (f"\n\n{pref.get('description', '')}" if pref.get('description') else ""))
-                if st.button("Hide Preferences", key="hide_prefs", use_container_width=True):
-                    st.session_state.show_current_prefs_result = False
-                    st.rerun()
+                    st.dataframe(current_prefs, hide_index=True, use_container_width=True)
+                button("Hide Preferences", key="hide_prefs_btn",
+                       on_click=self._hide_prefs_cb)
                 st.markdown("---")
         
         pref_request = st.text_area(
@@ -202,7 +266,7 @@ class PreferencesApp:
             height=150
         )
         
-        if st.button("Send Request", key="send_pref_request", type="primary", use_container_width=True):
+        if button("Send Request", key="send_pref_request", type="primary"):
             if not pref_request:
                 st.error("Please enter your request first")
                 return
@@ -210,12 +274,16 @@ class PreferencesApp:
             with st.spinner("Processing preference request..."):
                 try:
                     result = self.preferences.process_request(pref_request)
+                    # Updates and removals rewrite the preferences file
+                    _load_prefs_cached.clear()
                     
-                    if (result and "identified_preferences" in result and 
-                        result["identified_preferences"] and 
-                        any(details.get('confidence', 0) >= (confidence_threshold - 10) for name, details in result["identified_preferences"].items())):
+                    # Surface candidates slightly below the threshold so the user can confirm them
+                    min_conf = confidence_threshold - 10
+                    identified = (result or {}).get("identified_preferences") or {}
+                    if any(details.get('confidence', 0) >= min_conf for details in identified.values()):
                         
                         st.session_state.detected_preferences = result["identified_preferences"]
+                        st.session_state.pop('detected_split_key', None)
                         st.session_state.suggested_prompt = result.get("suggested_prompt", "Would you like to save these preferences?")
                         st.session_state.show_preference_confirmation = True
                         st.rerun()
@@ -239,19 +307,11 @@ class PreferencesApp:
                             else:
                                 detail = "No removals were necessary."
                         elif action == 'list':
+                            # The preferences panel itself is the feedback; it sits above, so rerun to show it
                             st.session_state.show_current_prefs_result = True
-                            message = "Here are your current preferences."
-                            detail = ""
-                            
                             if "current_preferences" in result:
-                                formatted_prefs = []
-                                for name, details in result["current_preferences"].items():
-                                    formatted_prefs.append({
-                                        "name": name,
-                                        "value": details["value"],
-                                        "description": details.get("explanation", "")
-                                    })
-                                st.session_state.current_preferences = formatted_prefs
+                                st.session_state.current_preferences = _format_prefs(result["current_preferences"])
+                            st.rerun(scope="fragment")
                         elif action == 'help':
                             message = result.get('message', 'Here is help with managing your preferences.')
                             detail = result.get('help_text', '')
@@ -259,15 +319,13 @@ class PreferencesApp:
                             message = result.get('message', 'Preferences processed successfully!')
                             detail = result.get('action_taken', '')
                         
-                        # show success pop-up and rerun
-                        st.session_state.success_message = message
-                        if detail:
-                            st.session_state.success_message += f"\n\n{detail}"
-                        st.session_state.show_success_popup = True
-                        st.rerun()
+                        st.toast(f"{message}\n\n{detail}" if detail else message, icon="✅")
                     else:
                         st.error(result.get('error', 'Failed to process preference request'))
-                except Exception as e:
+                except (ValueError, KeyError, TypeError, AttributeError, OSError) as e:
+                    # process_request already turns API failures into an error result;
+                    # this only guards reading that result
+                    logger.exception("Failed to handle preference request")
                     st.error(f"Error managing preferences: {str(e)}")
 
 # for standalone testing
@@ -278,55 +336,12 @@ if __name__ == "__main__":
         layout="centered"
     )
     
-    st.markdown("""
-    <style>
-        .stButton button {
-            width: 100%;
-        }
-        .stTextArea textarea {
-            border-radius: 5px;
-            border: 1px solid #ddd;
-        }
-        .stAlert {
-            border-radius: 5px;
-        }
-        .stMarkdown h3 {
-            color: #2196F3;
-            margin-top: 20px;
-        }
-        .button-container {
-            display: flex;
-            justify-content: center;
-            gap: 10px;
-            margin-top: 10px;
-        }
-        h1, h2, h3 {
-            color: #2196F3;
-        }
-        /* Success pop-up styling */
-        .success-dialog {
-            background-color: #e8f5e9;
-            border-radius: 10px;
-            padding: 20px;
-            margin: 20px 0;
-            border-left: 5px solid #4CAF50;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        }
-        /* Preference dialog styling */
-        .preference-dialog {
-            background-color: #f0f2f6;
-            border-radius: 10px;
-            padding: 20px;
-            margin: 20px 0;
-            border-left: 5px solid #2196F3;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(STANDALONE_CSS, unsafe_allow_html=True)
     
     st.title("AI Preferences Management")
     
-    app = PreferencesApp()
+    # Reuse one instance across reruns, as app_st does for its tabs
+    app = st.cache_resource(PreferencesApp)()
     app.render()
     
     # Footer
@@ -10,268 +10,391 @@ parent_dir = str(Path(__file__).parent.parent.absolute())
 if parent_dir not in sys.path:
     sys.path.append(parent_dir)
 
-from tools.lancedb_manager import LanceDBManager
+from kb_shared import get_db_manager, clear_category_caches
 
 # Define CSS
+KB_MANAGER_CSS = """
+<style>
+    .main .block-container {
+        padding-top: 2rem;
+        padding-bottom: 2rem;
+    }
+    .stButton button {
+        width: 100%;
+    }
+    .success-message {
+        padding: 10px;
+        background-color: #d4edda;
+        color: #155724;
+        border-radius: 5px;
+        margin-bottom: 10px;
+    }
+    .error-message {
+        padding: 10px;
+        background-color: #f8d7da;
+        color: #721c24;
+        border-radius: 5px;
+        margin-bottom: 10px;
+    }
+    .warning-message {
+        padding: 10px;
+        background-color: #fff3cd;
+        color: #856404;
+        border-radius: 5px;
+        margin-bottom: 10px;
+    }
+    .info-card {
+        background-color: #f8f9fa;
+        padding: 20px;
+        border-radius: 5px;
+        margin-bottom: 20px;
+    }
+    .hierarchy-view {
+        font-family: monospace;
+        white-space: pre-wrap;
+        background-color: #f5f5f5;
+        padding: 15px;
+        border-radius: 5px;
+    }
+    /* Tree view styling */
+    .tree-item {
+        margin-left: 20px;
+    }
+    .tree-category {
+        font-weight: bold;
+        color: #5a5a5a;
+    }
+    .tree-topic {
+        color: #007bff;
+    }
+    .tree-subtopic {
+        color: #28a745;
+    }
+    .tree-entry {
+        color: #dc3545;
+    }
+    .subtitle {
+        font-size: 1.5rem;
+        margin-bottom: 1rem;
+        border-bottom: 1px solid #0066cc33;
+        padding-bottom: 0.5rem;
+        color: #0066cc;
+    }
+    /* Table styling */
+    .dataframe {
+        width: 100%;
+        border-collapse: collapse;
+        border: 1px solid #0066cc33; /* Subtle blue border */
+        border-radius: 5px;
+        overflow: hidden; /* Makes sure the border-radius works */
+        margin-bottom: 20px;
+        box-shadow: 0 2px 5px rgba(0, 102, 204, 0.1); /* Subtle blue shadow */
+    }
+    .dataframe th {
+        background-color: #0066cc;
+        color: white;
+        text-align: left;
+        padding: 10px 8px; /* Slightly more top/bottom padding */
+    }
+    .dataframe td {
+        border: 1px solid #ddd;
+        padding: 8px;
+    }
+    .dataframe tr:nth-child(even) {
+        background-color: #f0f5ff; /* Subtle blue tint */
+    }
+    .dataframe tr:hover {
+        background-color: #d4e6ff; /* Light blue on hover */
+    }
+    /* Tab styling */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 24px;
+    }
+    .stTabs [data-baseweb="tab"] {
+        height: 50px;
+        white-space: pre-wrap;
+        background-color: #f0f0f0;
+        border-radius: 4px 4px 0px 0px;
+        gap: 1px;
+        padding-top: 10px;
+        padding-bottom: 10px;
+        color: #555; /* Darker text color for better contrast */
+        font-weight: 500;
+        border: 1px solid #ddd;
+    }
+    .stTabs [aria-selected="true"] {
+        background-color: #0066cc !important; /* Blue background for selected tab */
+        color: white !important;
+        font-weight: 600;
+        border: 1px solid #0066cc;
+    }
+    /* Hover effect for tabs */
+    .stTabs [data-baseweb="tab"]:hover {
+        background-color: #e0e0e0;
+        cursor: pointer;
+    }
+    /* Expander styling */
+    .streamlit-expanderHeader {
+        background-color: #f0f5ff;
+        border-radius: 5px;
+        border-left: 4px solid #0066cc;
+        padding: 10px;
+        font-weight: 500;
+    }
+    .streamlit-expanderHeader:hover {
+        background-color: #d4e6ff;
+    }
+    .streamlit-expanderContent {
+        border-left: 1px solid #0066cc33;
+        padding-left: 20px;
+        margin-left: 10px;
+    }
+    /* Heading styling */
+    h1, h2, h3 {
+        color: #0066cc;
+    }
+    h2 {
+        border-bottom: 1px solid #0066cc33;
+        padding-bottom: 0.5rem;
+    }
+    /* Action buttons styling - override the width: 100% for action buttons */
+    div[data-testid="column"] .stButton button {
+        width: auto !important;
+        border-radius: 4px;
+        border: 1px solid #ddd;
+        padding: 3px 10px;
+        font-size: 0.85rem;
+        font-weight: 500;
+        min-width: 60px;
+        transition: all 0.2s;
+    }
+    /* Standard button */
+    button[data-testid^="stButton-"] {
+        background-color: #f8f9fa;
+        color: #0066cc;
+        border-color: #0066cc33;
+    }
+    button[data-testid^="stButton-"]:hover {
+        background-color: #e7f0ff;
+        border-color: #0066cc;
+    }
+    /* Action buttons container - better spacing */
+    div[data-testid="column"] .stButton {
+        margin: 0 2px;
+        display: inline-block;
+    }
+    /* Delete buttons */
+    button[data-testid^="stButton-"]:has(div:contains("Delete")) {
+        color: #dc3545;
+        border-color: #dc354533;
+    }
+    button[data-testid^="stButton-"]:has(div:contains("Delete")):hover {
+        background-color: #ffebee;
+        border-color: #dc3545;
+    }
+    /* Edit buttons */
+    button[data-testid^="stButton-"]:has(div:contains("Edit")) {
+        color: #28a745;
+        border-color: #28a74533;
+    }
+    button[data-testid^="stButton-"]:has(div:contains("Edit")):hover {
+        background-color: #e7f5e7;
+        border-color: #28a745;
+    }
+    /* View buttons */
+    button[data-testid^="stButton-"]:has(div:contains("View")) {
+        color: #0066cc;
+        border-color: #0066cc33;
+    }
+    button[data-testid^="stButton-"]:has(div:contains("View")):hover {
+        background-color: #e7f0ff;
+        border-color: #0066cc;
+    }
+    hr {
+        margin: 8px 0;
+        border: 0;
+        border-top: 1px solid #eee;
+    }
+    /* Navigation radio rendered as tabs */
+    div[data-testid*="stHorizontalBlock"] div[data-testid="stRadio"] {
+        width: 100%;
+        margin-bottom: 1rem;
+        /* Add a line under the tabs */
+        border-bottom: 1px solid #ddd;
+    }
+    div[data-testid*="stHorizontalBlock"] div[data-testid="stRadio"] > div {
+        display: flex;
+        justify-content: space-between;
+        flex-direction: row;
+        width: 100%;
+    }
+    div[data-testid*="stHorizontalBlock"] div[data-testid="stRadio"] label {
+        background-color: #f0f0f0;
+        padding: 10px 15px;
+        border-radius: 4px 4px 0 0;
+        border: 1px solid #ddd;
+        border-bottom: none;
+        font-weight: 500;
+        text-align: center;
+        color: #555;
+        min-width: 120px;
+        transition: all 0.3s;
+    }
+    div[data-testid*="stHorizontalBlock"] div[data-testid="stRadio"] label:hover {
+        background-color: #e0e0e0;
+        cursor: pointer;
+    }
+    div[data-testid*="stHorizontalBlock"] div[data-testid="stRadio"] label[data-baseweb="radio"]:has(input:checked) {
+        background-color: #0066cc !important;
+        color: white !important;
+        font-weight: 600;
+        border: 1px solid #0066cc;
+        border-bottom: none;
+    }
+    /* Hide the radio button circle */
+    div[data-testid*="stHorizontalBlock"] div[data-testid="stRadio"] label div:first-child {
+        display: none;
+    }
+    /* Add CSS for hierarchical styling */
+    .hierarchy-container {
+        font-family: monospace;
+        white-space: pre-wrap;
+        background-color: rgba(var(--theme-background-color-secondary-rgb), 0.3);
+        color: var(--theme-text-color-primary);
+        padding: 20px;
+        border-radius: 5px;
+        border-left: 3px solid var(--theme-primary-color);
+        margin: 10px 0;
+    }
+    .category-item {
+        font-weight: bold;
+        color: var(--theme-primary-color);
+    }
+    .topic-item {
+        font-weight: bold;
+        color: var(--theme-primary-color);
+        margin-left: 20px;
+    }
+    .entry-item {
+        margin-left: 40px;
+    }
+    .note-text {
+        color: var(--theme-text-color-secondary);
+        font-style: italic;
+    }
+    .tag-text {
+        color: var(--theme-text-color-secondary);
+        font-style: italic;
+    }
+</style>
+"""
+
 def local_css():
-    st.markdown("""
-    <style>
-        .main .block-container {
-            padding-top: 2rem;
-            padding-bottom: 2rem;
-        }
-        .stButton button {
-            width: 100%;
-        }
-        .success-message {
-            padding: 10px;
-            background-color: #d4edda;
-            color: #155724;
-            border-radius: 5px;
-            margin-bottom: 10px;
-        }
-        .error-message {
-            padding: 10px;
-            background-color: #f8d7da;
-            color: #721c24;
-            border-radius: 5px;
-            margin-bottom: 10px;
-        }
-        .warning-message {
-            padding: 10px;
-            background-color: #fff3cd;
-            color: #856404;
-            border-radius: 5px;
-            margin-bottom: 10px;
-        }
-        .info-card {
-            background-color: #f8f9fa;
-            padding: 20px;
-            border-radius: 5px;
-            margin-bottom: 20px;
-        }
-        .hierarchy-view {
-            font-family: monospace;
-            white-space: pre-wrap;
-            background-color: #f5f5f5;
-            padding: 15px;
-            border-radius: 5px;
-        }
-        /* Tree view styling */
-        .tree-item {
-            margin-left: 20px;
-        }
-        .tree-category {
-            font-weight: bold;
-            color: #5a5a5a;
-        }
-        .tree-topic {
-            color: #007bff;
-        }
-        .tree-subtopic {
-            color: #28a745;
-        }
-        .tree-entry {
-            color: #dc3545;
-        }
-        .subtitle {
-            font-size: 1.5rem;
-            margin-bottom: 1rem;
-            border-bottom: 1px solid #0066cc33;
-            padding-bottom: 0.5rem;
-            color: #0066cc;
-        }
-        /* Table styling */
-        .dataframe {
-            width: 100%;
-            border-collapse: collapse;
-            border: 1px solid #0066cc33; /* Subtle blue border */
-            border-radius: 5px;
-            overflow: hidden; /* Makes sure the border-radius works */
-            margin-bottom: 20px;
-            box-shadow: 0 2px 5px rgba(0, 102, 204, 0.1); /* Subtle blue shadow */
-        }
-        .dataframe th {
-            background-color: #0066cc;
-            color: white;
-            text-align: left;
-            padding: 10px 8px; /* Slightly more top/bottom padding */
-        }
-        .dataframe td {
-            border: 1px solid #ddd;
-            padding: 8px;
-        }
-        .dataframe tr:nth-child(even) {
-            background-color: #f0f5ff; /* Subtle blue tint */
-        }
-        .dataframe tr:hover {
-            background-color: #d4e6ff; /* Light blue on hover */
-        }
-        /* Tab styling */
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 24px;
-        }
-        .stTabs [data-baseweb="tab"] {
-            height: 50px;
-            white-space: pre-wrap;
-            background-color: #f0f0f0;
-            border-radius: 4px 4px 0px 0px;
-            gap: 1px;
-            padding-top: 10px;
-            padding-bottom: 10px;
-            color: #555; /* Darker text color for better contrast */
-            font-weight: 500;
-            border: 1px solid #ddd;
-        }
-        .stTabs [aria-selected="true"] {
-            background-color: #0066cc !important; /* Blue background for selected tab */
-            color: white !important;
-            font-weight: 600;
-            border: 1px solid #0066cc;
-        }
-        /* Hover effect for tabs */
-        .stTabs [data-baseweb="tab"]:hover {
-            background-color: #e0e0e0;
-            cursor: pointer;
-        }
-        /* Expander styling */
-        .streamlit-expanderHeader {
-            background-color: #f0f5ff;
-            border-radius: 5px;
-            border-left: 4px solid #0066cc;
-            padding: 10px;
-            font-weight: 500;
-        }
-        .streamlit-expanderHeader:hover {
-            background-color: #d4e6ff;
-        }
-        .streamlit-expanderContent {
-            border-left: 1px solid #0066cc33;
-            padding-left: 20px;
-            margin-left: 10px;
-        }
-        /* Heading styling */
-        h1, h2, h3 {
-            color: #0066cc;
-        }
-        h2 {
-            border-bottom: 1px solid #0066cc33;
-            padding-bottom: 0.5rem;
-        }
-        /* Entry table styling */
-        .entry-row {
-            padding: 10px 0;
-            border-bottom: 1px solid #eee;
-            transition: background-color 0.2s;
-        }
-        .entry-row:hover {
-            background-color: #f0f5ff;
-        }
-        /* Action buttons styling - override the width: 100% for action buttons */
-        .entry-row .stButton button,
-        div[data-testid="column"] .stButton button {
-            width: auto !important;
-            border-radius: 4px;
-            border: 1px solid #ddd;
-            padding: 3px 10px;
-            font-size: 0.85rem;
-            font-weight: 500;
-            min-width: 60px;
-            transition: all 0.2s;
-        }
-        /* Standard button */
-        button[data-testid^="stButton-"] {
-            background-color: #f8f9fa;
-            color: #0066cc;
-            border-color: #0066cc33;
-        }
-        button[data-testid^="stButton-"]:hover {
-            background-color: #e7f0ff;
-            border-color: #0066cc;
-        }
-        /* Action buttons container - better spacing */
-        .entry-row .stButton,
-        div[data-testid="column"] .stButton {
-            margin: 0 2px;
-            display: inline-block;
-        }
-        /* Delete buttons */
-        button[data-testid^="stButton-"]:has(div:contains("Delete")) {
-            color: #dc3545;
-            border-color: #dc354533;
-        }
-        button[data-testid^="stButton-"]:has(div:contains("Delete")):hover {
-            background-color: #ffebee;
-            border-color: #dc3545;
-        }
-        /* Edit buttons */
-        button[data-testid^="stButton-"]:has(div:contains("Edit")) {
-            color: #28a745;
-            border-color: #28a74533;
-        }
-        button[data-testid^="stButton-"]:has(div:contains("Edit")):hover {
-            background-color: #e7f5e7;
-            border-color: #28a745;
-        }
-        /* View buttons */
-        button[data-testid^="stButton-"]:has(div:contains("View")) {
-            color: #0066cc;
-            border-color: #0066cc33;
-        }
-        button[data-testid^="stButton-"]:has(div:contains("View")):hover {
-            background-color: #e7f0ff;
-            border-color: #0066cc;
-        }
-        /* Entry table row separator */
-        hr {
-            margin: 8px 0;
-            border: 0;
-            border-top: 1px solid #eee;
-        }
-        /* Entry title styling */
-        .entry-title {
-            font-weight: 500;
-            color: #0066cc;
-            cursor: pointer;
-            text-decoration: none;
-        }
-        .entry-title:hover {
-            text-decoration: underline;
-            font-weight: 600;
-        }
-        /* Add CSS for hierarchical styling */
-        .hierarchy-container {
-            font-family: monospace;
-            white-space: pre-wrap;
-            background-color: rgba(var(--theme-background-color-secondary-rgb), 0.3);
-            color: var(--theme-text-color-primary);
-            padding: 20px;
-            border-radius: 5px;
-            border-left: 3px solid var(--theme-primary-color);
-            margin: 10px 0;
-        }
-        .category-item {
-            font-weight: bold;
-            color: var(--theme-primary-color);
-        }
-        .topic-item {
-            font-weight: bold;
-            color: var(--theme-primary-color);
-            margin-left: 20px;
-        }
-        .entry-item {
-            margin-left: 40px;
-        }
-        .note-text {
-            color: var(--theme-text-color-secondary);
-            font-style: italic;
-        }
-        .tag-text {
-            color: var(--theme-text-color-secondary);
-            font-style: italic;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    # Emitted on every run: Streamlit removes elements a rerun does not emit again
+    st.markdown(KB_MANAGER_CSS, unsafe_allow_html=True)
+
+
+# Number of entry rows rendered per page in the entry manager
+ENTRY_PAGE_SIZE = 25
+CONTENT_PREVIEW_CHARS = 2000
+HIERARCHY_ENTRY_TEMPLATE = '<div class="entry-item">Entry {number}: {title} ({date}){tags}</div>\n'
+
+# Reads are cached per database path; KBManagerApp clears them after every write
+# Only the columns the manager pages display; this skips the entries' embedding vectors
+CATEGORY_COLUMNS = ['id', 'name', 'description']
+TOPIC_COLUMNS = ['id', 'name', 'description']
+ENTRY_COLUMNS = ['id', 'title', 'created_at', 'content', 'tags_json']
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_categories(db_path, _manager):
+    return _manager.get_categories(columns=CATEGORY_COLUMNS)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_topics(db_path, _manager, category_id):
+    return _manager.get_topics(category_id, columns=TOPIC_COLUMNS)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_entries(db_path, _manager, topic_id):
+    return _manager.get_entries(topic_id, columns=ENTRY_COLUMNS)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_category(db_path, _manager, category_id):
+    return _manager.get_category(category_id)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_topic(db_path, _manager, topic_id):
+    return _manager.get_topic(topic_id)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_entry(db_path, _manager, entry_id):
+    return _manager.get_entry(entry_id)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_hierarchy(db_path, _manager):
+    """Nest the flat hierarchy read into categories -> topics -> entries"""
+    flat = _manager.get_hierarchy_flat()
+    categories = []
+    for category_id, category_rows in flat.groupby('category_id', sort=False):
+        topics = []
+        for _, topic_rows in category_rows.dropna(subset=['topic_id']).groupby('topic_id', sort=False):
+            entries = topic_rows.dropna(subset=['entry_id'])[['title', 'created_at', 'tags_json']].to_dict('records')
+            for entry in entries:
+                entry['tags'] = json.loads(entry['tags_json']) if entry['tags_json'] else []
+            topics.append({"name": topic_rows['topic_name'].iloc[0], "entries": entries})
+        categories.append({"id": category_id, "name": category_rows['category_name'].iloc[0], "topics": topics})
+    return {"categories": categories}
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_hierarchy_category_html(db_path, _manager, category_id, i):
+    """Build the topic and entry markup under one category, numbered as the i-th, once per KB change"""
+    category = next((c for c in _cached_hierarchy(db_path, _manager)["categories"] if c["id"] == category_id), None)
+    if category is None or not category["topics"]:
+        return '<div class="hierarchy-container"><div class="note-text" style="margin-left: 20px;">No topics in this category</div></div>'
+    
+    parts = ['<div class="hierarchy-container">']
+    
+    for j, topic in enumerate(category["topics"]):
+        parts.append(f'<div class="topic-item">Topic {i+1}.{j+1}: {topic["name"]}</div>\n\n')
+        if not topic["entries"]:
+            parts.append('<div class="note-text" style="margin-left: 40px;">No entries in this topic</div>\n\n')
+            continue
+        
+        total_entries = len(topic["entries"])
+        displayed_entries = topic["entries"][:5]
+        
+        for k, entry in enumerate(displayed_entries):
+            tags_html = f' <span class="tag-text">[{", ".join(entry["tags"])}]</span>' if entry['tags'] else ''
+            parts.append(HIERARCHY_ENTRY_TEMPLATE.format(
+                number=f"{i+1}.{j+1}.{k+1}", title=entry["title"],
+                date=entry['created_at'].partition('T')[0], tags=tags_html,
+            ))
+    
+        if total_entries > 5:
+            parts.append(f'<div class="note-text" style="margin-left: 40px;">... and {total_entries - 5} more entries</div>\n')
+        
+        parts.append('\n')
+    
+    parts.append('</div>')
+    return "".join(parts)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_category_options(db_path, _manager):
+    return ["Select a category", *_cached_categories(db_path, _manager)['name'].tolist()]
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_topic_options(db_path, _manager, category_id):
+    return ["Select a topic", *_cached_topics(db_path, _manager, category_id)['name'].tolist()]
+
+
+def _truncate_descriptions(descriptions, max_length=80):
+    """Shorten a column of descriptions for the list views in one vectorized pass"""
+    descriptions = descriptions.fillna("")
+    return descriptions.where(descriptions.str.len() <= max_length, descriptions.str.slice(0, max_length) + "...")
+
+
+def _set_state(**values):
+    """Button callback: update session state before the rerun the click already triggers."""
+    st.session_state.update(values)
 
 
 class KBManagerApp:
@@ -284,136 +407,146 @@ class KBManagerApp:
             lancedb_path (str): Path to the LanceDB database
             show_page_config (bool): Whether to show the page config. Set to False when integrated in app_st.py
         """
-        self.manager = LanceDBManager(lancedb_path)
+        self.db_path = lancedb_path
+        self.manager = get_db_manager(lancedb_path)
+    
+    def _invalidate_cache(self):
+        """Drop cached categories, topics and entries after a write"""
+        _cached_categories.clear()
+        _cached_topics.clear()
+        _cached_entries.clear()
+        _cached_category.clear()
+        _cached_topic.clear()
+        _cached_entry.clear()
+        _cached_hierarchy.clear()
+        _cached_hierarchy_category_html.clear()
+        _cached_category_options.clear()
+        _cached_topic_options.clear()
+        clear_category_caches()
     
     def set_success(self, message):
         """Set success message in session state."""
         st.session_state.success_message = message
     
     def set_error(self, message):
-        """Set error message in session state."""
-        st.session_state.error_message = message
+        """Show an error message in place."""
+        st.error(message)
     
     def display_messages(self):
-        """Display success or error messages from the session state."""
-        if 'success_message' in st.session_state and st.session_state.success_message:
+        """Display the success message from the session state; errors are shown in place by set_error."""
+        if st.session_state.get('success_message'):
             st.success(st.session_state.success_message)
             st.session_state.success_message = None
-        
-        if 'error_message' in st.session_state and st.session_state.error_message:
-            st.error(st.session_state.error_message)
-            st.session_state.error_message = None
     
-    def render_category_manager(self):
-        """Render the category management section."""
-        st.markdown("<h2>Category Management</h2>", unsafe_allow_html=True)
+    def _render_entity_list(self, kind, table_name, df, columns, child_label, get_children, edit_form, delete, delete_warning):
+        """Render a selectable category or topic list with its view, edit and delete actions."""
+        st.markdown(f"<div class='subtitle'>Existing {table_name.capitalize()}</div>", unsafe_allow_html=True)
+        rows = df[columns].assign(
+            display_desc=_truncate_descriptions(df['description'])
+        ).to_dict('records')
         
-        categories_df = self.manager.get_categories()
+        # Use session state to track which row is being edited, viewed or deleted
+        edit_key, delete_key = f"edit_{kind}_id", f"delete_{kind}_id"
+        for key in (edit_key, f"view_{kind}_id", delete_key):
+            st.session_state.setdefault(key, None)
         
-        if not categories_df.empty:
-            st.markdown("<div class='subtitle'>Existing Categories</div>", unsafe_allow_html=True)
-            
-            # Use session state to track which category is being edited or viewed
-            if 'edit_category_id' not in st.session_state:
-                st.session_state.edit_category_id = None
-            if 'view_category_id' not in st.session_state:
-                st.session_state.view_category_id = None
-            if 'delete_category_id' not in st.session_state:
-                st.session_state.delete_category_id = None
+        # One table element for the whole list; actions apply to the selected row
+        table = st.dataframe(
+            pd.DataFrame({
+                "Name": [row['name'] for row in rows],
+                "Description": [row['display_desc'] for row in rows],
+            }),
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                "Name": st.column_config.TextColumn(width="medium"),
+                "Description": st.column_config.TextColumn(width="large"),
+            },
+            on_select="rerun",
+            selection_mode="single-row",
+            key=f"{kind}_table",
+        )
+        
+        if not table.selection.rows:
+            st.caption(f"Select a {kind} to view, edit or delete it.")
+        else:
+            row = rows[table.selection.rows[0]]
+            item_id = row['id']
+            view_states = st.session_state.setdefault('view_states', {})
+            view_key = (kind, item_id)
             
-            # Initialize the view state for each category
-            for _, row in categories_df.iterrows():
-                category_id = row['id']
-                if f"view_state_category_{category_id}" not in st.session_state:
-                    st.session_state[f"view_state_category_{category_id}"] = False
+            action_col1, action_col2, action_col3 = st.columns(3)
+            if action_col1.button("View", key=f"btn_view_{kind}", help=f"View {kind} details"):
+                view_states[view_key] = not view_states.get(view_key, False)
+                st.session_state[f"view_{kind}_id"] = item_id
             
-            cols = st.columns([4, 5, 3])
-            cols[0].markdown("<b>Name</b>", unsafe_allow_html=True)
-            cols[1].markdown("<b>Description</b>", unsafe_allow_html=True)
-            cols[2].markdown("<b>Actions</b>", unsafe_allow_html=True)
+            if action_col2.button("Edit", key=f"btn_edit_{kind}", help=f"Edit this {kind}"):
+                st.session_state[edit_key] = item_id
+                st.session_state.edit_mode = True
             
-            st.markdown("<hr>", unsafe_allow_html=True)
+            if action_col3.button("Delete", key=f"btn_delete_{kind}", help=f"Delete this {kind}"):
+                st.session_state[delete_key] = item_id
+                st.session_state[f"delete_{kind}_name"] = row['name']
             
-            for _, row in categories_df.iterrows():
-                category_id = row['id']
-                name = row['name']
-                description = row['description']
-                
-                # Add category row with hover effect
-                st.markdown(f"<div class='entry-row'>", unsafe_allow_html=True)
-                
-                cols = st.columns([4, 5, 3])
-                cols[0].markdown(f"<div class='entry-title' onclick=\"this.style.fontWeight='bold'; document.getElementById('btn_view_category_{category_id}').click()\">{name}</div>", unsafe_allow_html=True)
-                
-                # Show truncated description
-                max_desc_length = 80
-                display_desc = description if len(description) <= max_desc_length else description[:max_desc_length] + "..."
-                cols[1].markdown(f"{display_desc}")
-                
-                # buttons for the action column
-                action_col1, action_col2, action_col3 = cols[2].columns(3)
-                if action_col1.button("View", key=f"btn_view_category_{category_id}", help="View category details"):
-                    st.session_state[f"view_state_category_{category_id}"] = not st.session_state[f"view_state_category_{category_id}"]
-                    st.session_state.view_category_id = category_id
-                
-                if action_col2.button("Edit", key=f"btn_edit_category_{category_id}", help="Edit this category"):
-                    st.session_state.edit_category_id = category_id
-                    st.session_state.edit_mode = True
-                
-                if action_col3.button("Delete", key=f"btn_delete_category_{category_id}", help="Delete this category"):
-                    st.session_state.delete_category_id = category_id
-                
-                st.markdown("</div>", unsafe_allow_html=True)
-                st.markdown("<hr>", unsafe_allow_html=True)
+            if view_states.get(view_key, False):
+                with st.expander(f"Details for: {row['name']}", expanded=True):
+                    st.markdown(f"**Name:** {row['name']}")
+                    st.markdown(f"**Description:** {row['description']}")
+                    
+                    children = get_children(item_id)
+                    if len(children):
+                        st.markdown(f"**{child_label.capitalize()} in this {kind}:**")
+                        st.markdown(", ".join([f"`{child}`" for child in children]))
+                    else:
+                        st.info(f"No {child_label} in this {kind} yet.")
+                    
+                    st.button("Close", key=f"btn_close_{kind}", on_click=view_states.pop, args=(view_key, None))
+        
+        # process edit and delete actions
+        if st.session_state.get(edit_key):
+            edit_form(st.session_state[edit_key])
+            st.button("Cancel Editing", key=f"btn_cancel_edit_{kind}",
+                      on_click=_set_state, kwargs={edit_key: None, "edit_mode": False})
+        
+        if st.session_state.get(delete_key):
+            item_id = st.session_state[delete_key]
+            # The name is stored with the id when Delete is clicked
+            item_name = st.session_state.get(f"delete_{kind}_name")
             
-            # process edit and delete actions
-            if 'edit_category_id' in st.session_state and st.session_state.edit_category_id:
-                category_id = st.session_state.edit_category_id
-                self.display_category_form(edit=True, category_id=category_id)
-                if st.button("Cancel Editing", key="btn_cancel_edit_category"):
-                    st.session_state.edit_category_id = None
-                    st.session_state.edit_mode = False
-                    st.rerun()
+            st.warning(f"Are you sure you want to delete the {kind}: **{item_name}**? {delete_warning}")
+            col1, col2 = st.columns(2)
             
-            if 'delete_category_id' in st.session_state and st.session_state.delete_category_id:
-                category_id = st.session_state.delete_category_id
-                category_name = categories_df[categories_df['id'] == category_id]['name'].iloc[0]
-                
-                st.warning(f"Are you sure you want to delete the category: **{category_name}**? This will also delete all topics and entries in this category.")
-                col1, col2 = st.columns(2)
-                
-                if col1.button("Yes, Delete", key="btn_confirm_delete_category"):
-                    try:
-                        if self.manager.delete_category(category_id):
-                            self.set_success(f"Category '{category_name}' deleted successfully!")
-                            st.session_state.delete_category_id = None
-                            st.rerun()
-                    except Exception as e:
-                        self.set_error(f"Error deleting category: {str(e)}")
-                
-                if col2.button("Cancel", key="btn_cancel_delete_category"):
-                    st.session_state.delete_category_id = None
-                    st.rerun()
+            if col1.button("Yes, Delete", key=f"btn_confirm_delete_{kind}"):
+                try:
+                    if delete(item_id):
+                        self._invalidate_cache()
+                        self.set_success(f"{kind.capitalize()} '{item_name}' deleted successfully!")
+                        st.session_state[delete_key] = None
+                        st.session_state.pop(f"delete_{kind}_name", None)
+                        st.rerun()
+                except Exception as e:
+                    self.set_error(f"Error deleting {kind}: {str(e)}")
             
-            # Display category details for the viewed category
-            for _, row in categories_df.iterrows():
-                category_id = row['id']
-                if 'view_state_category_' + category_id in st.session_state and st.session_state['view_state_category_' + category_id]:
-                    with st.expander(f"Details for: {row['name']}", expanded=True):
-                        st.markdown(f"**Name:** {row['name']}")
-                        st.markdown(f"**Description:** {row['description']}")
-                        
-                        topics_df = self.manager.get_topics(category_id)
-                        if not topics_df.empty:
-                            st.markdown("**Topics in this category:**")
-                            topics_list = ", ".join([f"`{topic}`" for topic in topics_df['name']])
-                            st.markdown(topics_list)
-                        else:
-                            st.info("No topics in this category yet.")
-                        
-                        if st.button("Close", key=f"btn_close_category_{category_id}"):
-                            st.session_state[f"view_state_category_{category_id}"] = False
-                            st.rerun()
+            col2.button("Cancel", key=f"btn_cancel_delete_{kind}",
+                        on_click=_set_state, kwargs={delete_key: None, f"delete_{kind}_name": None})
+    
+    # Each manager section is a fragment so its widgets rerun only that section
+    @st.fragment
+    def render_category_manager(self):
+        """Render the category management section."""
+        st.markdown("<h2>Category Management</h2>", unsafe_allow_html=True)
+        
+        categories_df = _cached_categories(self.db_path, self.manager)
+        
+        if not categories_df.empty:
+            self._render_entity_list(
+                "category", "categories", categories_df, CATEGORY_COLUMNS,
+                child_label="topics",
+                get_children=lambda category_id: _cached_topics(self.db_path, self.manager, category_id)['name'],
+                edit_form=lambda category_id: self.display_category_form(edit=True, category_id=category_id),
+                delete=self.manager.delete_category,
+                delete_warning="This will also delete all topics and entries in this category.",
+            )
         
         st.markdown("<div class='subtitle'>Create New Category</div>", unsafe_allow_html=True)
         self.display_category_form()
@@ -423,7 +556,7 @@ class KBManagerApp:
         category_data = None
         
         if edit and category_id:
-            category_data = self.manager.get_category(category_id).iloc[0]
+            category_data = _cached_category(self.db_path, self.manager, category_id).iloc[0]
         
         with st.form("category_form"):
             name = st.text_input("Category Name", value=category_data['name'] if category_data is not None else "")
@@ -434,6 +567,7 @@ class KBManagerApp:
                 if submit_button:
                     try:
                         self.manager.update_category(category_id, name, description)
+                        self._invalidate_cache()
                         self.set_success(f"Category '{name}' updated successfully!")
                         st.session_state.edit_mode = False
                         st.rerun()
@@ -444,125 +578,41 @@ class KBManagerApp:
                 if submit_button:
                     try:
                         category_id = self.manager.create_category(name, description)
+                        self._invalidate_cache()
                         self.set_success(f"Category '{name}' created successfully!")
                         st.rerun()
                     except Exception as e:
                         self.set_error(f"Error creating category: {str(e)}")
     
+    @st.fragment
     def render_topic_manager(self):
         """Render the topic management section."""
         st.markdown("<h2>Topic Management</h2>", unsafe_allow_html=True)
     
-        categories_df = self.manager.get_categories()
+        categories_df = _cached_categories(self.db_path, self.manager)
         if categories_df.empty:
             st.info("Please create a category first.")
             return
         
-        category_options = categories_df['name'].tolist()
-        category_options.insert(0, "Select a category")
+        category_ids = dict(zip(categories_df['name'], categories_df['id']))
+        category_options = _cached_category_options(self.db_path, self.manager)
         
         selected_category_name = st.selectbox("Select a category:", category_options, key="topic_category_select")
         
         if selected_category_name != "Select a category":
-            category_id = categories_df[categories_df['name'] == selected_category_name]['id'].iloc[0]
+            category_id = category_ids[selected_category_name]
             st.session_state.selected_category = category_id
             
-            topics_df = self.manager.get_topics(category_id)
+            topics_df = _cached_topics(self.db_path, self.manager, category_id)
             if not topics_df.empty:
-                st.markdown("<div class='subtitle'>Existing Topics</div>", unsafe_allow_html=True)
-                
-                if 'edit_topic_id' not in st.session_state:
-                    st.session_state.edit_topic_id = None
-                if 'view_topic_id' not in st.session_state:
-                    st.session_state.view_topic_id = None
-                if 'delete_topic_id' not in st.session_state:
-                    st.session_state.delete_topic_id = None
-                
-                for _, row in topics_df.iterrows():
-                    topic_id = row['id']
-                    if f"view_state_topic_{topic_id}" not in st.session_state:
-                        st.session_state[f"view_state_topic_{topic_id}"] = False
-                
-                cols = st.columns([4, 5, 3])
-                cols[0].markdown("<b>Name</b>", unsafe_allow_html=True)
-                cols[1].markdown("<b>Description</b>", unsafe_allow_html=True)
-                cols[2].markdown("<b>Actions</b>", unsafe_allow_html=True)
-                
-                st.markdown("<hr>", unsafe_allow_html=True)
-                
-                for _, row in topics_df.iterrows():
-                    topic_id = row['id']
-                    name = row['name']
-                    description = row['description']
-                    
-                    st.markdown(f"<div class='entry-row'>", unsafe_allow_html=True)
-                    
-                    cols = st.columns([4, 5, 3])
-                    cols[0].markdown(f"<div class='entry-title' onclick=\"this.style.fontWeight='bold'; document.getElementById('btn_view_topic_{topic_id}').click()\">{name}</div>", unsafe_allow_html=True)
-                    
-                    # Show truncated description
-                    max_desc_length = 80
-                    display_desc = description if len(description) <= max_desc_length else description[:max_desc_length] + "..."
-                    cols[1].markdown(f"{display_desc}")
-
-                    action_col1, action_col2, action_col3 = cols[2].columns(3)
-                    if action_col1.button("View", key=f"btn_view_topic_{topic_id}", help="View topic details"):
-                        st.session_state[f"view_state_topic_{topic_id}"] = not st.session_state[f"view_state_topic_{topic_id}"]
-                        st.session_state.view_topic_id = topic_id
-                    
-                    if action_col2.button("Edit", key=f"btn_edit_topic_{topic_id}", help="Edit this topic"):
-                        st.session_state.edit_topic_id = topic_id
-                        st.session_state.edit_mode = True
-                    
-                    if action_col3.button("Delete", key=f"btn_delete_topic_{topic_id}", help="Delete this topic"):
-                        st.session_state.delete_topic_id = topic_id
-                    
-                    st.markdown("</div>", unsafe_allow_html=True)
-                    st.markdown("<hr>", unsafe_allow_html=True)
-                
-                if 'edit_topic_id' in st.session_state and st.session_state.edit_topic_id:
-                    topic_id = st.session_state.edit_topic_id
-                    self.display_topic_form(category_id, edit=True, topic_id=topic_id)
-                    if st.button("Cancel Editing", key="btn_cancel_edit_topic"):
-                        st.session_state.edit_topic_id = None
-                        st.session_state.edit_mode = False
-                        st.rerun()
-                
-                if 'delete_topic_id' in st.session_state and st.session_state.delete_topic_id:
-                    topic_id = st.session_state.delete_topic_id
-                    topic_name = topics_df[topics_df['id'] == topic_id]['name'].iloc[0]
-                    
-                    st.warning(f"Are you sure you want to delete the topic: **{topic_name}**? This will also delete all entries in this topic.")
-                    col1, col2 = st.columns(2)
-                    
-                    if col1.button("Yes, Delete", key="btn_confirm_delete_topic"):
-                        try:
-                            if self.manager.delete_topic(topic_id):
-                                self.set_success(f"Topic '{topic_name}' deleted successfully!")
-                                st.session_state.delete_topic_id = None
-                                st.rerun()
-                        except Exception as e:
-                            self.set_error(f"Error deleting topic: {str(e)}")
-                
-                for _, row in topics_df.iterrows():
-                    topic_id = row['id']
-                    if 'view_state_topic_' + topic_id in st.session_state and st.session_state['view_state_topic_' + topic_id]:
-                        with st.expander(f"Details for: {row['name']}", expanded=True):
-                            st.markdown(f"**Name:** {row['name']}")
-                            st.markdown(f"**Description:** {row['description']}")
-                            
-                            # Get entries for this topic
-                            entries_df = self.manager.get_entries(topic_id)
-                            if not entries_df.empty:
-                                st.markdown("**Entries in this topic:**")
-                                entries_list = ", ".join([f"`{entry}`" for entry in entries_df['title']])
-                                st.markdown(entries_list)
-                            else:
-                                st.info("No entries in this topic yet.")
-                            
-                            if st.button("Close", key=f"btn_close_topic_{topic_id}"):
-                                st.session_state[f"view_state_topic_{topic_id}"] = False
-                                st.rerun()
+                self._render_entity_list(
+                    "topic", "topics", topics_df, TOPIC_COLUMNS,
+                    child_label="entries",
+                    get_children=lambda topic_id: _cached_entries(self.db_path, self.manager, topic_id)['title'],
+                    edit_form=lambda topic_id: self.display_topic_form(category_id, edit=True, topic_id=topic_id),
+                    delete=self.manager.delete_topic,
+                    delete_warning="This will also delete all entries in this topic.",
+                )
             
             # Create new topic form
             st.markdown("<div class='subtitle'>Create New Topic</div>", unsafe_allow_html=True)
@@ -573,7 +623,7 @@ class KBManagerApp:
         topic_data = None
         
         if edit and topic_id:
-            topic_data = self.manager.get_topic(topic_id).iloc[0]
+            topic_data = _cached_topic(self.db_path, self.manager, topic_id).iloc[0]
         
         with st.form("topic_form"):
             name = st.text_input("Topic Name", value=topic_data['name'] if topic_data is not None else "")
@@ -584,6 +634,7 @@ class KBManagerApp:
                 if submit_button:
                     try:
                         self.manager.update_topic(topic_id, name, description)
+                        self._invalidate_cache()
                         self.set_success(f"Topic '{name}' updated successfully!")
                         st.session_state.edit_mode = False
                         st.rerun()
@@ -594,20 +645,21 @@ class KBManagerApp:
                 if submit_button:
                     try:
                         topic_id = self.manager.create_topic(category_id, name, description)
+                        self._invalidate_cache()
                         self.set_success(f"Topic '{name}' created successfully!")
                         st.rerun()
                     except Exception as e:
                         self.set_error(f"Error creating topic: {str(e)}")
     
+    @st.fragment
     def render_entry_manager(self):
         """Render the entry management section."""
         st.markdown("<h2>Entry Management</h2>", unsafe_allow_html=True)
-        if 'show_new_entry_form' not in st.session_state:
-            st.session_state.show_new_entry_form = False
+        st.session_state.setdefault('show_new_entry_form', False)
         
         should_display_form = False
         
-        categories_df = self.manager.get_categories()
+        categories_df = _cached_categories(self.db_path, self.manager)
         if categories_df.empty:
             st.info("Please create a category first.")
             col1, col2, col3 = st.columns([3, 2, 3])
@@ -617,111 +669,107 @@ class KBManagerApp:
                     should_display_form = True
             
         else:
-            category_options = categories_df['name'].tolist()
-            category_options.insert(0, "Select a category")
+            category_ids = dict(zip(categories_df['name'], categories_df['id']))
+            category_options = _cached_category_options(self.db_path, self.manager)
             
             selected_category_name = st.selectbox("Select a category:", category_options, key="entry_category_select")
             
             if selected_category_name != "Select a category":
-                category_id = categories_df[categories_df['name'] == selected_category_name]['id'].iloc[0]
+                category_id = category_ids[selected_category_name]
                 st.session_state.selected_category = category_id
                 
-                topics_df = self.manager.get_topics(category_id)
+                topics_df = _cached_topics(self.db_path, self.manager, category_id)
+                topic_ids = dict(zip(topics_df['name'], topics_df['id']))
                 if topics_df.empty:
                     st.info("Please create a topic for this category first.")
                 else:
-                    topic_options = topics_df['name'].tolist()
-                    topic_options.insert(0, "Select a topic")
+                    topic_options = _cached_topic_options(self.db_path, self.manager, category_id)
                     
                     selected_topic_name = st.selectbox("Select a topic:", topic_options, key="entry_topic_select")
                     
                     if selected_topic_name != "Select a topic":
-                        topic_id = topics_df[topics_df['name'] == selected_topic_name]['id'].iloc[0]
+                        topic_id = topic_ids[selected_topic_name]
                         st.session_state.selected_topic = topic_id
                         
-                        entries_df = self.manager.get_entries(topic_id)
+                        entries_df = _cached_entries(self.db_path, self.manager, topic_id)
                         
                         if not entries_df.empty:
                             st.markdown("<div class='subtitle'>Existing Entries</div>", unsafe_allow_html=True)
-                            cols = st.columns([4, 2, 3])
-                            cols[0].markdown("<b>Title</b>", unsafe_allow_html=True)
-                            cols[1].markdown("<b>Created</b>", unsafe_allow_html=True)
-                            cols[2].markdown("<b>Actions</b>", unsafe_allow_html=True)
                             
-                            st.markdown("<hr>", unsafe_allow_html=True)
+                            # Only one page of entries is rendered; reset to the first page when the topic changes
+                            if st.session_state.get('entry_page_topic') != topic_id:
+                                st.session_state.entry_page_topic = topic_id
+                                st.session_state.entry_page = 0
+                            page_count = max(1, -(-len(entries_df) // ENTRY_PAGE_SIZE))
+                            page = min(st.session_state.entry_page, page_count - 1)
+                            page_df = entries_df.iloc[page * ENTRY_PAGE_SIZE:(page + 1) * ENTRY_PAGE_SIZE]
+                            # Date part of the ISO timestamp and parsed tags, computed once for the whole page
+                            entry_rows = page_df[ENTRY_COLUMNS].assign(
+                                created_date=page_df['created_at'].str.split('T', n=1).str[0],
+                                tags=page_df['tags_json'].map(lambda tags_json: json.loads(tags_json) if tags_json else []),
+                            ).to_dict('records')
+                            # One table element for the page; actions apply to the selected row
+                            table = st.dataframe(
+                                pd.DataFrame({
+                                    "Title": [row['title'] for row in entry_rows],
+                                    "Created": [row['created_date'] for row in entry_rows],
+                                    "Tags": [row['tags'] for row in entry_rows],
+                                }),
+                                hide_index=True,
+                                use_container_width=True,
+                                column_config={
+                                    "Title": st.column_config.TextColumn(width="large"),
+                                    "Created": st.column_config.TextColumn(width="small"),
+                                    "Tags": st.column_config.ListColumn(width="medium"),
+                                },
+                                on_select="rerun",
+                                selection_mode="single-row",
+                                # A new topic or page starts without a selection
+                                key=f"entry_table_{topic_id}_{page}",
+                            )
                             
-                            for idx, row in entries_df.iterrows():
-                                entry_id = row['id']
-                                title = row['title']
-                                created = row['created_at'].split('T')[0] if 'T' in row['created_at'] else row['created_at']
-                                
-                                # Add entry row
-                                st.markdown(f"<div class='entry-row'>", unsafe_allow_html=True)
-                                
-                                cols = st.columns([4, 2, 3])
-                                cols[0].markdown(f"<div class='entry-title'>{title}</div>", unsafe_allow_html=True)
-                                cols[1].markdown(f"{created}")
-                                
-
-                                action_col1, action_col2, action_col3 = cols[2].columns(3)
-                                if action_col1.button(key=f"btn_view_{entry_id}", label="View"):
-                                    st.session_state[f"view_entry_{entry_id}"] = True
-                                
-                                if action_col2.button(key=f"btn_edit_{entry_id}", label="Edit"):
-                                    st.session_state.edit_entry_id = entry_id
-                                
-                                if action_col3.button(key=f"btn_delete_{entry_id}", label="Delete"):
-                                    st.session_state.delete_entry_id = entry_id
-                                
-                                st.markdown("</div>", unsafe_allow_html=True)
-                                st.markdown("<hr>", unsafe_allow_html=True)
-                                
-                                # expand entry details if view button was clicked
-                                if st.session_state.get(f"view_entry_{entry_id}", False):
-                                    with st.expander(f"Details for: {title}", expanded=True):
-                                        st.markdown(f"**Title:** {title}")
-                                        st.markdown("**Content:**")
-                                        st.markdown(row['content'])
-                                        
-                                        # Show tags if any
-                                        if row['tags_json']:
-                                            tags = json.loads(row['tags_json'])
-                                            tags_str = ", ".join([f"`{tag}`" for tag in tags]) if tags else ""
-                                            st.markdown(f"**Tags:** {tags_str}")
-                                        
-                                        if st.button(key=f"btn_close_{entry_id}", label="Close"):
-                                            st.session_state[f"view_entry_{entry_id}"] = False
-                                            st.rerun()
+                            if not table.selection.rows:
+                                st.caption("Select an entry to view, edit or delete it.")
+                            else:
+                                self._render_entry_actions(entry_rows[table.selection.rows[0]]['id'])
                         
-                            if 'edit_entry_id' in st.session_state and st.session_state.edit_entry_id:
-                                entry_id = st.session_state.edit_entry_id
+                            if page_count > 1:
+                                prev_col, page_col, next_col = st.columns([1, 2, 1])
+                                prev_col.button("◀ Prev", key="btn_entry_page_prev", disabled=page == 0,
+                                                on_click=_set_state, kwargs={"entry_page": page - 1})
+                                first_shown = page * ENTRY_PAGE_SIZE + 1
+                                last_shown = min((page + 1) * ENTRY_PAGE_SIZE, len(entries_df))
+                                page_col.markdown(f"<div style='text-align: center;'>Page {page + 1} of {page_count} · entries {first_shown}–{last_shown} of {len(entries_df)}</div>", unsafe_allow_html=True)
+                                next_col.button("Next ▶", key="btn_entry_page_next", disabled=page >= page_count - 1,
+                                                on_click=_set_state, kwargs={"entry_page": page + 1})
+                            
+                            # One pending (action, entry id) request instead of a key per action
+                            action, entry_id = st.session_state.get('entry_action') or (None, None)
+                            if action == "edit":
                                 st.markdown("<div class='subtitle'>Edit Entry</div>", unsafe_allow_html=True)
-                                self.display_entry_form(topic_id=st.session_state.selected_topic, edit=True, entry_id=entry_id)
-                                if st.button("Cancel Editing", key="btn_cancel_edit_entry"):
-                                    st.session_state.edit_entry_id = None
-                                    st.rerun()
+                                self.display_entry_form(topic_id=st.session_state.selected_topic, edit=True,
+                                                        entry_id=entry_id)
+                                st.button("Cancel Editing", key="btn_cancel_edit_entry",
+                                          on_click=_set_state, kwargs={"entry_action": None})
 
-                            if 'delete_entry_id' in st.session_state and st.session_state.delete_entry_id:
-                                entry_id = st.session_state.delete_entry_id
-                                entry_data = self.manager.get_entry(entry_id)
-                                if not entry_data.empty:
-                                    entry_title = entry_data.iloc[0]['title']
-                                    
-                                    st.warning(f"Are you sure you want to delete the entry: **{entry_title}**?")
-                                    col1, col2 = st.columns(2)
-                                    
-                                    if col1.button("Yes, Delete", key="btn_confirm_delete_entry"):
-                                        try:
-                                            if self.manager.delete_entry(entry_id):
-                                                self.set_success(f"Entry '{entry_title}' deleted successfully!")
-                                                st.session_state.delete_entry_id = None
-                                                st.rerun()
-                                        except Exception as e:
-                                            self.set_error(f"Error deleting entry: {str(e)}")
-                                    
-                                    if col2.button("Cancel", key="btn_cancel_delete_entry"):
-                                        st.session_state.delete_entry_id = None
-                                        st.rerun()
+                            if action == "delete":
+                                entry = _cached_entry(self.db_path, self.manager, entry_id)
+                                entry_title = entry.iloc[0]['title'] if entry is not None and not entry.empty else entry_id
+                                st.warning(f"Are you sure you want to delete the entry: **{entry_title}**?")
+                                col1, col2 = st.columns(2)
+                                
+                                if col1.button("Yes, Delete", key="btn_confirm_delete_entry"):
+                                    try:
+                                        if self.manager.delete_entry(entry_id):
+                                            self._invalidate_cache()
+                                            self.set_success(f"Entry '{entry_title}' deleted successfully!")
+                                            st.session_state.entry_action = None
+                                            st.rerun()
+                                    except Exception as e:
+                                        self.set_error(f"Error deleting entry: {str(e)}")
+                                
+                                col2.button("Cancel", key="btn_cancel_delete_entry",
+                                            on_click=_set_state, kwargs={"entry_action": None})
                         else:
                             st.info("No entries found in this topic. Use the button below to create one.")
             else:
@@ -735,16 +783,59 @@ class KBManagerApp:
                 with create_entry_container:
                     st.markdown("<div class='subtitle'>Create New Entry</div>", unsafe_allow_html=True)
                     self.display_entry_form()
-                    if st.button("Cancel", key="cancel_new_entry"):
-                        st.session_state.show_new_entry_form = False
-                        st.rerun()
+                    st.button("Cancel", key="cancel_new_entry",
+                              on_click=_set_state, kwargs={"show_new_entry_form": False})
             else:
                 with create_entry_container:
                     col1, col2, col3 = st.columns([3, 2, 3])
                     with col2:
-                        if st.button("➕ Create New Entry", key="create_new_entry_button_bottom", use_container_width=True):
-                            st.session_state.show_new_entry_form = True
-                            st.rerun()  # Rerun to show the form
+                        st.button("➕ Create New Entry", key="create_new_entry_button_bottom", use_container_width=True,
+                                  on_click=_set_state, kwargs={"show_new_entry_form": True})
+    
+    @st.fragment
+    def _render_entry_actions(self, entry_id):
+        """Render the actions for the selected entry; toggling its details reruns only this fragment."""
+        # Re-read by id so a fragment rerun never shows the row captured before an edit or delete
+        entry = _cached_entry(self.db_path, self.manager, entry_id)
+        if entry is None or entry.empty:
+            return
+        row = entry.iloc[0]
+        title = row['title']
+        view_states = st.session_state.setdefault('view_states', {})
+        view_key = ("entry", entry_id)
+        
+        # Only the selected entry has actions, so the widget keys do not need its id
+        action_col1, action_col2, action_col3 = st.columns(3)
+        if action_col1.button(key="btn_view_entry", label="View"):
+            view_states[view_key] = True
+        
+        # Edit and delete are handled by the entry manager below the list, so rerun it
+        if action_col2.button(key="btn_edit_entry", label="Edit"):
+            st.session_state.entry_action = ("edit", entry_id)
+            st.rerun()
+        
+        if action_col3.button(key="btn_delete_entry", label="Delete"):
+            st.session_state.entry_action = ("delete", entry_id)
+            st.rerun()
+        
+        # expand entry details if view button was clicked
+        if view_states.get(view_key, False):
+            with st.expander(f"Details for: {title}", expanded=True):
+                st.markdown(f"**Title:** {title}")
+                st.markdown("**Content:**")
+                # Long content is previewed; the full markdown renders only on request
+                content = row['content'] or ""
+                if len(content) > CONTENT_PREVIEW_CHARS and not st.checkbox("Show full content", key=f"show_full_entry_content_{entry_id}"):
+                    st.markdown(content[:CONTENT_PREVIEW_CHARS] + "…")
+                else:
+                    st.markdown(content)
+                
+                # Show tags if any
+                if row['tags_json']:
+                    tags_str = ", ".join([f"`{tag}`" for tag in json.loads(row['tags_json'])])
+                    st.markdown(f"**Tags:** {tags_str}")
+                
+                st.button(key="btn_close_entry", label="Close", on_click=view_states.pop, args=(view_key, None))
     
     def display_entry_form(self, topic_id=None, edit=False, entry_id=None):
         """Display form for creating or editing an entry."""
@@ -752,7 +843,7 @@ class KBManagerApp:
         tags = []
         
         if edit and entry_id:
-            entry_data = self.manager.get_entry(entry_id).iloc[0]
+            entry_data = _cached_entry(self.db_path, self.manager, entry_id).iloc[0]
             if entry_data['tags_json']:
                 tags = json.loads(entry_data['tags_json'])
         
@@ -769,8 +860,10 @@ class KBManagerApp:
                 if submit_button:
                     try:
                         self.manager.update_entry(entry_id, title, content, tags)
+                        self._invalidate_cache()
                         self.set_success(f"Entry '{title}' updated successfully!")
                         st.session_state.edit_mode = False
+                        st.session_state.entry_action = None
                         st.rerun()
                     except Exception as e:
                         self.set_error(f"Error updating entry: {str(e)}")
@@ -782,7 +875,7 @@ class KBManagerApp:
                 if tags_input:
                     tags = [tag.strip() for tag in tags_input.split(",") if tag.strip()]
                 
-                categories_df = self.manager.get_categories()
+                categories_df = _cached_categories(self.db_path, self.manager)
                 selected_category_id = None
                 target_topic_id = topic_id  # Default is the current topic
                 
@@ -790,11 +883,12 @@ class KBManagerApp:
                     st.markdown("### Entry Location")
                     category_options = categories_df['name'].tolist()
                     category_ids = categories_df['id'].tolist()
+                    cat_name_to_id = dict(zip(category_options, category_ids))
                     
                     # If we have a current topic, auto-select its category
                     if topic_id:
                         try:
-                            topic_data = self.manager.get_topic(topic_id).iloc[0]
+                            topic_data = _cached_topic(self.db_path, self.manager, topic_id).iloc[0]
                             category_id = topic_data['category_id']
                             if category_id in category_ids:
                                 default_idx = category_ids.index(category_id)
@@ -812,11 +906,12 @@ class KBManagerApp:
                         key="new_entry_category"
                     )
                     
-                    selected_category_id = categories_df[categories_df['name'] == selected_category]['id'].iloc[0]
-                    topics_df = self.manager.get_topics(selected_category_id)
+                    selected_category_id = cat_name_to_id[selected_category]
+                    topics_df = _cached_topics(self.db_path, self.manager, selected_category_id)
                     if not topics_df.empty:
                         topic_options = topics_df['name'].tolist()
                         topic_ids = topics_df['id'].tolist()
+                        topic_name_to_id = dict(zip(topic_options, topic_ids))
                         
                         # auto-select the topic if there's any
                         if topic_id and topic_id in topic_ids:
@@ -831,7 +926,7 @@ class KBManagerApp:
                             key="new_entry_topic"
                         )
                         
-                        target_topic_id = topics_df[topics_df['name'] == selected_topic]['id'].iloc[0]
+                        target_topic_id = topic_name_to_id[selected_topic]
                     else:
                         st.warning("Please create a topic in the selected category first.")
                 
@@ -840,6 +935,7 @@ class KBManagerApp:
                     try:
                         if title and target_topic_id:
                             self.manager.create_entry(target_topic_id, title, content, tags)
+                            self._invalidate_cache()
                             self.set_success(f"Entry '{title}' created successfully!")
                             st.rerun()
                         elif not title:
@@ -854,115 +950,35 @@ class KBManagerApp:
         st.markdown("<h2>Knowledge Base Hierarchy</h2>", unsafe_allow_html=True)
         
         try:
-            # Get the full view of lancedb hierarchy
-            hierarchy = self.manager.get_full_hierarchy()
+            hierarchy = _cached_hierarchy(self.db_path, self.manager)
             
             if not hierarchy["categories"]:
                 st.info("No data available in the knowledge base yet.")
                 return
             
-            html_content = '<div class="hierarchy-container">'
-            
+            # Only category headings render up front; a category's topics and entries render when opened
             for i, category in enumerate(hierarchy["categories"]):
-                html_content += f'<div class="category-item">Category {i+1}: {category["name"]}</div>\n\n'
-                
-                if not category["topics"]:
-                    html_content += '<div class="note-text" style="margin-left: 20px;">No topics in this category</div>\n\n'
-                    continue
-                
-                for j, topic in enumerate(category["topics"]):
-                    html_content += f'<div class="topic-item">Topic {i+1}.{j+1}: {topic["name"]}</div>\n\n'
-                    if not topic["entries"]:
-                        html_content += '<div class="note-text" style="margin-left: 40px;">No entries in this topic</div>\n\n'
-                        continue
-                    
-                    total_entries = len(topic["entries"])
-                    displayed_entries = topic["entries"][:5]
-                    
-                    for k, entry in enumerate(displayed_entries):
-                        created_date = entry['created_at'].split('T')[0] if 'T' in entry['created_at'] else entry['created_at']
-                        html_content += f'<div class="entry-item">Entry {i+1}.{j+1}.{k+1}: {entry["title"]} ({created_date})'
-                        if entry['tags']:
-                            tags_text = ", ".join(entry['tags'])
-                            html_content += f' <span class="tag-text">[{tags_text}]</span>'
-                        
-                        html_content += '</div>\n'
-                
-                    if total_entries > 5:
-                        html_content += f'<div class="note-text" style="margin-left: 40px;">... and {total_entries - 5} more entries</div>\n'
-                    
-                    html_content += '\n'
-            
-            html_content += '</div>'
-            
-            st.markdown(html_content, unsafe_allow_html=True)
+                self._render_hierarchy_category(i, category["id"], category["name"])
                 
         except Exception as e:
             st.error(f"Error loading hierarchy: {str(e)}")
             st.exception(e)  
     
-    def render(self):
-        """Main rendering function."""
-        local_css()
-        
-        st.title("Knowledge Base Manager")
-        st.markdown("Manage your knowledge base structure and content")
-        
-        self.display_messages()
-        
-        if 'kb_manager_active_tab' not in st.session_state:
-            st.session_state.kb_manager_active_tab = 0
+    def _render_hierarchy_category(self, i, category_id, name):
+        """Render one category heading and, once opened, its topics and entries."""
+        if st.toggle(f"Category {i+1}: {name}", key=f"hierarchy_category_{category_id}"):
+            st.markdown(_cached_hierarchy_category_html(self.db_path, self.manager, category_id, i), unsafe_allow_html=True)
+    
+    # Switching tabs reruns only the navigation and the active tab, not the page header and styles
+    @st.fragment
+    def _render_tabs(self):
+        """Render the navigation tabs and the active tab."""
+        st.session_state.setdefault('kb_manager_active_tab', 0)
         
         tab_names = ["Categories", "Topics", "Entries", "Hierarchy View"]
         active_tab = st.radio("Navigation Tabs", tab_names, index=st.session_state.kb_manager_active_tab, horizontal=True, label_visibility="collapsed")
         
         st.session_state.kb_manager_active_tab = tab_names.index(active_tab)
-    
-        st.markdown("""
-        <style>
-            div[data-testid*="stHorizontalBlock"] div[data-testid="stRadio"] {
-                width: 100%;
-                margin-bottom: 1rem;
-            }
-            div[data-testid*="stHorizontalBlock"] div[data-testid="stRadio"] > div {
-                display: flex;
-                justify-content: space-between;
-                flex-direction: row;
-                width: 100%;
-            }
-            div[data-testid*="stHorizontalBlock"] div[data-testid="stRadio"] label {
-                background-color: #f0f0f0;
-                padding: 10px 15px;
-                border-radius: 4px 4px 0 0;
-                border: 1px solid #ddd;
-                border-bottom: none;
-                font-weight: 500;
-                text-align: center;
-                color: #555;
-                min-width: 120px;
-                transition: all 0.3s;
-            }
-            div[data-testid*="stHorizontalBlock"] div[data-testid="stRadio"] label:hover {
-                background-color: #e0e0e0;
-                cursor: pointer;
-            }
-            div[data-testid*="stHorizontalBlock"] div[data-testid="stRadio"] label[data-baseweb="radio"]:has(input:checked) {
-                background-color: #0066cc !important;
-                color: white !important;
-                font-weight: 600;
-                border: 1px solid #0066cc;
-                border-bottom: none;
-            }
-            /* Hide the radio button circle */
-            div[data-testid*="stHorizontalBlock"] div[data-testid="stRadio"] label div:first-child {
-                display: none;
-            }
-            /* Add a line under the tabs */
-            div[data-testid*="stHorizontalBlock"] div[data-testid="stRadio"] {
-                border-bottom: 1px solid #ddd;
-            }
-        </style>
-        """, unsafe_allow_html=True)
         
         if active_tab == "Categories":
             self.render_category_manager()
@@ -972,6 +988,16 @@ class KBManagerApp:
             self.render_entry_manager()
         elif active_tab == "Hierarchy View":
             self.render_hierarchy_view()
+    
+    def render(self):
+        """Main rendering function."""
+        local_css()
+        
+        st.title("Knowledge Base Manager")
+        st.markdown("Manage your knowledge base structure and content")
+        
+        self.display_messages()
+        self._render_tabs()
         
         st.markdown("---")
         st.markdown("Knowledge Base Manager v1.0")
@@ -980,7 +1006,8 @@ class KBManagerApp:
 
 
 def main():
-    app = KBManagerApp()
+    # Reuse one instance across reruns, as app_st does for its tabs
+    app = st.cache_resource(KBManagerApp)()
     app.render()
 
 
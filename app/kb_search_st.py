@@ -8,6 +8,8 @@ import pandas as pd
 import json
 import traceback
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
 
 parent_dir = Path(__file__).resolve().parent.parent
 sys.path.append(str(parent_dir))
@@ -15,9 +17,26 @@ from tools.knowledge_base import KnowledgeBase
 from tools.qa_processor import QAProcessor
 from tools.lancedb_manager import LanceDBManager
 from tools.user_preferences import UserPreferences
+from kb_shared import cached_filter_categories, cached_filter_topics
 
 KB_MANAGER_DB_PATH = "data/lancedb"
 
+CSS_PATH = Path(__file__).with_name("kb_search.css")
+
+# QA calls from all sessions share one bounded pool instead of a new thread per query;
+# cached so standalone runs, which re-execute this module, do not build a pool per rerun
+@st.cache_resource
+def _get_qa_pool():
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="qa")
+
+# Recent QA answers, so repeating a query or nudging the threshold skips the LLM call
+QA_CACHE_SIZE = 64
+
+@st.cache_resource
+def _get_qa_cache():
+    """LRU of recent QA answers and the lock guarding it, shared by all sessions"""
+    return OrderedDict(), threading.Lock()
+
 # Initialize knowledge base outside the app class to prevent reinitialization
 # on each Streamlit rerun
 @st.cache_resource
@@ -36,7 +55,8 @@ def initialize_kb():
             print(f"Note: LanceDB table not found - {str(e)}")
             kb = None
         
-        db_manager = LanceDBManager(db_path=KB_MANAGER_DB_PATH)
+        # Share the knowledge base's connection rather than opening a second one
+        db_manager = LanceDBManager(db_path=KB_MANAGER_DB_PATH, db=kb.db if kb is not None else None)
         
         # initialize QA processor if KB is available
         # or if there are entries in the entries table
@@ -44,9 +64,9 @@ def initialize_kb():
         try:
             db = db_manager.db
             if "entries" in db.table_names():
-                entries_table = db.open_table("entries")
-                has_entries = entries_table.count_rows() > 0
-                print(f"Found entries table with {entries_table.count_rows()} records")
+                entry_count = db.open_table("entries").count_rows()
+                has_entries = entry_count > 0
+                print(f"Found entries table with {entry_count} records")
         except Exception as e:
             print(f"Error checking entries table: {str(e)}")
             
@@ -87,7 +107,62 @@ def initialize_kb():
             "error": error_msg
         }
 
+@st.cache_data
+def _load_css(css_path):
+    """Read the stylesheet once per process instead of rebuilding it on every rerun"""
+    return f"<style>{Path(css_path).read_text(encoding='utf-8')}</style>"
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_kb_stats(db_path, _kb):
+    """Knowledge base stats, refreshed at most every 30 seconds"""
+    return _kb.get_stats()
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def _cached_saved_preferences(prefs_path, prefs_mtime, _user_preferences):
+    """Load the saved preferences; keyed on mtime so the file is only re-read after it changes"""
+    return _user_preferences._load_preferences()
+
+class _PrefixedState:
+    """st.session_state view that adds the app's key prefix"""
+    __slots__ = ("prefix",)
+    
+    def __init__(self, prefix):
+        self.prefix = prefix
+    
+    def __getitem__(self, key):
+        return st.session_state[self.prefix + key]
+    
+    def __setitem__(self, key, value):
+        st.session_state[self.prefix + key] = value
+    
+    def get(self, key, default=None):
+        return st.session_state.get(self.prefix + key, default)
+    
+    def setdefault(self, key, default=None):
+        return st.session_state.setdefault(self.prefix + key, default)
+
 class KnowledgeBaseSearchApp:
+    # Session state defaults, stored under the app's key prefix
+    _SESSION_DEFAULTS = {
+        "query": "",
+        "search_triggered": False,
+        "results": None,
+        "error": None,
+        "preferences_applied": False,
+        "last_updated": None,
+        "api_key_status": "unknown",
+        "use_qa": True,
+        "relevance_threshold": 0.4,
+        "qa_timeout": 30,
+        "result_limit": 10,
+        "show_debug": False,
+        "viewing_content": None,
+        "viewing_source": None,
+        "selected_category": None,
+        "selected_topic": None,
+        "show_filters": False,
+    }
+    
     def __init__(self, standalone_mode=False, kb_resources=None):
         """Initialize the Knowledge Base Search application
         
@@ -107,20 +182,16 @@ class KnowledgeBaseSearchApp:
         
         # Add prefix for session state variables to avoid conflicts when integrated with app_st.py
         self.prefix = "kb_" if not standalone_mode else ""
+        self.ss = _PrefixedState(self.prefix)
         
-        self._apply_custom_css()
         self.user_preferences = UserPreferences()
-        self._init_session_state()
         
         if kb_resources and kb_resources.get("initialized", False):
             self.kb = kb_resources.get("kb")
             self.db_manager = kb_resources.get("db_manager")
             self.qa_processor = kb_resources.get("qa_processor")
-            
-            if self.kb:
-                kb_stats = self.kb.get_stats()
-                st.session_state[f"{self.prefix}kb_stats"] = kb_stats
-                print(f"Using provided knowledge base resources. Stats: {kb_stats}")
+            self.init_error = None
+            print("Using provided knowledge base resources")
         else:
             resources = initialize_kb()
             self.kb = resources.get("kb")
@@ -128,381 +199,141 @@ class KnowledgeBaseSearchApp:
             self.qa_processor = resources.get("qa_processor")
             
             if resources.get("initialized", False):
-                if self.kb:
-                    kb_stats = self.kb.get_stats()
-                    st.session_state[f"{self.prefix}kb_stats"] = kb_stats
-                    print(f"Initialized knowledge base. Stats: {kb_stats}")
+                self.init_error = None
+                print("Initialized knowledge base")
             else:
-                st.session_state[f"{self.prefix}error"] = resources.get("error", "Unknown error initializing knowledge base")
+                self.init_error = resources.get("error", "Unknown error initializing knowledge base")
                 print(f"Error initializing knowledge base: {resources.get('error')}")
+        
+        self._init_session_state()
     
     def _apply_custom_css(self):
         """Apply custom CSS styling to the app"""
-        st.markdown("""
-        <style>
-            .main {
-                background-color: var(--background-color);
-                color: var(--text-color);
-            }
-            .stApp {
-                max-width: 900px;
-                margin: 0 auto;
-            }
-            .search-result {
-                background-color: var(--background-color);
-                border-radius: 5px;
-                padding: 15px;
-                margin-bottom: 15px;
-                border-left: 4px solid #4CAF50;
-                box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-            }
-            .search-result h4 {
-                margin-top: 0;
-                color: var(--text-color);
-            }
-            .search-result p {
-                margin-bottom: 10px;
-                color: var(--text-color);
-            }
-            .metadata {
-                font-size: 0.8em;
-                color: var(--secondary-text-color);
-                margin-top: 10px;
-                padding-top: 5px;
-                border-top: 1px solid var(--border-color);
-            }
-            .relevance-high {
-                color: #27AE60;
-                font-weight: bold;
-            }
-            .relevance-medium {
-                color: #F39C12;
-            }
-            .relevance-low {
-                color: #E74C3C;
-            }
-            .answer-box {
-                background-color: #E8F5E9;
-                border-radius: 5px;
-                padding: 20px;
-                margin: 20px 0;
-                border-left: 5px solid #2E7D32;
-                color: #1B5E20;
-            }
-            .footer {
-                margin-top: 50px;
-                text-align: center;
-                color: var(--secondary-text-color);
-                font-size: 0.8em;
-            }
-            .success-dialog {
-                margin-bottom: 20px;
-            }
-            .error-box {
-                background-color: var(--error-bg-color);
-                color: var(--error-text-color);
-                padding: 16px;
-                border-radius: 8px;
-                margin-bottom: 16px;
-            }
-            .warning-box {
-                background-color: var(--warning-bg-color);
-                color: var(--warning-text-color);
-                padding: 16px;
-                border-radius: 8px;
-                margin-bottom: 16px;
-            }
-            .success-box {
-                background-color: var(--success-bg-color);
-                color: var(--success-text-color);
-                padding: 16px;
-                border-radius: 8px;
-                margin-bottom: 16px;
-            }
-            .debug-box {
-                background-color: var(--secondary-bg-color);
-                color: var(--secondary-text-color);
-                padding: 16px;
-                border-radius: 8px;
-                margin-bottom: 16px;
-                font-family: monospace;
-                white-space: pre-wrap;
-            }
-            .search-container {
-                margin-bottom: 20px;
-            }
-            .search-button-container {
-                display: flex;
-                justify-content: flex-end;
-                margin-top: 10px;
-            }
-            /* Fix for Streamlit text input */
-            .stTextInput input {
-                color: var(--text-color) !important;
-                background-color: var(--background-color) !important;
-            }
-          
-            /* Source link buttons styling */
-            .stButton button[data-baseweb="button"] {
-                width: 100%;
-                margin: 5px 0;
-                padding: 8px 10px;
-                font-size: 0.9em;
-                white-space: nowrap;
-                overflow: hidden;
-                text-overflow: ellipsis;
-                border-radius: 4px;
-            }
-            
-            /* Source grid layout */
-            .source-grid {
-                display: grid;
-                grid-template-columns: repeat(3, 1fr);
-                gap: 10px;
-                margin-bottom: 20px;
-            }
-            
-            /* Content preview styling */
-            .content-preview {
-                background-color: var(--secondary-bg-color);
-                padding: 10px;
-                border-radius: 4px;
-                margin: 10px 0;
-                border-left: 3px solid #2196F3;
-            }
-            
-            /* View/Hide content buttons */
-            .view-button button {
-                background-color: #2196F3 !important;
-                color: white !important;
-            }
-            
-            .hide-button button {
-                background-color: #f44336 !important;
-                color: white !important;
-                margin-top: 10px;
-            }
-                
-            .stCheckbox [data-baseweb="checkbox"] div[data-testid="stMarkdownContainer"] p {
-                color: #2196F3 !important;
-                font-weight: 500;
-            }
-            .stCheckbox [data-baseweb="checkbox"] [data-testid="stMarkdownContainer"] {
-                color: #2196F3 !important;
-            }
-            
-            .settings-expander {
-                padding: 10px 0;
-            }
-            
-            .slider-container {
-                margin: 20px 0;
-            }
-            /* Make the expander header more prominent */
-            button[data-baseweb="accordion"] div[data-testid="stMarkdownContainer"] p {
-                color: #2196F3 !important;
-                font-weight: bold !important;
-                font-size: 1.1em !important;
-            }
-            /* Upload container styles */
-            .upload-container {
-                padding: 10px 0;
-            }
-            .stExpander {
-                margin-bottom: 20px !important;
-            }
-            button[data-baseweb="accordion"] {
-                background-color: var(--background-color) !important;
-                border-radius: 8px !important;
-                padding: 10px !important;
-            }
-            .stExpander button p {
-                font-weight: 600 !important;
-                color: var(--text-color) !important;
-            }
-            /* Compact sliders */
-            .slider-container .stSlider {
-                padding-top: 0 !important;
-                padding-bottom: 0 !important;
-            }
-            /* Checkbox label style */
-            .stCheckbox [data-baseweb="checkbox"] div[data-testid="stMarkdownContainer"] p {
-                color: #2196F3 !important;
-                font-weight: 500;
-            }
-            .stCheckbox [data-baseweb="checkbox"] [data-testid="stMarkdownContainer"] {
-                color: #2196F3 !important;
-            }
-            /* File upload section styling */
-            .upload-section {
-                border: 2px dashed #aaa;
-                border-radius: 8px;
-                padding: 20px;
-                margin: 15px 0;
-                background-color: var(--background-color);
-                text-align: center;
-            }
-            .upload-icon {
-                font-size: 24px;
-                margin-bottom: 10px;
-            }
-            /* Progress indicator styling */
-            .stProgress .st-bo {
-                background-color: #2196F3;
-            }
-            .stProgress .st-bp {
-                height: 10px;
-                border-radius: 5px;
-            }
-        </style>
-        """, unsafe_allow_html=True)
+        # Re-emitted each run since Streamlit drops elements a rerun does not emit again
+        st.markdown(_load_css(str(CSS_PATH)), unsafe_allow_html=True)
+    
+    def _run_qa(self, question, docs_for_qa, relevance_threshold):
+        """Run one QA call on the shared pool; returns None after a timeout or error"""
+        # Run on the shared bounded pool so a slow LLM call cannot pile up threads
+        pool = _get_qa_pool()
+        if docs_for_qa:
+            future = pool.submit(
+                self.qa_processor.answer_question_with_docs,
+                question,
+                docs=docs_for_qa,
+                relevance_threshold=relevance_threshold
+            )
+        else:
+            future = pool.submit(
+                self.qa_processor.answer_question,
+                question,
+                max_results=5,
+                relevance_threshold=relevance_threshold
+            )
+        
+        timeout = self.ss.get("qa_timeout", 30)  
+        done, _ = wait({future}, timeout=timeout)
+        
+        if not done:
+            # Drops the call if it is still queued; a call already running finishes in the background
+            future.cancel()
+            print(f"QA processing timed out after {timeout} seconds")
+            self.ss["error"] = f"AI processing timed out after {timeout} seconds"
+            return None
+        
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"QA processing error: {str(e)}")
+            self.ss["error"] = f"AI processing error: {str(e)}"
+            return None
     
     def _process_with_qa(self, query, search_results):
         """
         Process the search results with QA processor to generate an answer.
         Returns the answer and the search results, or just the search results if QA fails.
         """
-        if not st.session_state.get(f"{self.prefix}use_qa", True) or not hasattr(self, 'qa_processor') or self.qa_processor is None:
+        if not self.ss.get("use_qa", True) or not hasattr(self, 'qa_processor') or self.qa_processor is None:
             return search_results
         
         print("Starting AI processing with QA processor")
         try:
-            # Use threading with timeout to prevent hanging
-            result_container = {"answer": None, "error": None, "preferences_applied": False}
-            
-            def process_question():
-                try:
-                    relevance_threshold = self._get_relevance_threshold()
+            relevance_threshold = self._get_relevance_threshold()
 
-                    user_preferences_str = ""
-                    preferences_applied = False
-                    
-                    # Add user preferences with contents and custom prompt if available
-                    if hasattr(self, 'user_preferences') and self.user_preferences:
-                        user_preferences_str = self.user_preferences.get_prompt_customization()
-                        if user_preferences_str:
-                            preferences_applied = True
-                            print(f"Applying user preferences to AI response: {user_preferences_str}")
-                    
-                    if search_results:
-                        docs_for_qa = []
-                        for result in search_results:
-                            docs_for_qa.append({
-                                'text': result.get('content', ''),
-                                'title': result.get('title', 'Untitled'),
-                                'source': result.get('source', 'Unknown'),
-                                'score': result.get('score', 1.0)
-                            })
-                        
-                        answer_result = self.qa_processor.answer_question_with_docs(
-                            query + (f"\n\nPlease apply these preferences: {user_preferences_str}" if user_preferences_str else ""),
-                            docs=docs_for_qa,
-                            relevance_threshold=relevance_threshold
-                        )
-                        
-                        result_container["answer"] = answer_result
-                        result_container["preferences_applied"] = preferences_applied
-                    else:
-                        answer_result = self.qa_processor.answer_question(
-                            query + (f"\n\nPlease apply these preferences: {user_preferences_str}" if user_preferences_str else ""),
-                            max_results=5,
-                            relevance_threshold=relevance_threshold
-                        )
-                        
-                        result_container["answer"] = answer_result
-                        result_container["preferences_applied"] = preferences_applied
-                except Exception as e:
-                    result_container["error"] = str(e)
+            user_preferences_str = ""
+            preferences_applied = False
             
-            qa_thread = threading.Thread(target=process_question)
-            qa_thread.daemon = True
-            qa_thread.start()
-            timeout = st.session_state.get(f"{self.prefix}qa_timeout", 30)  
-            qa_thread.join(timeout)
-            
-            if qa_thread.is_alive():
-                print(f"QA processing timed out after {timeout} seconds")
-                if hasattr(st, 'session_state'):
-                    st.session_state[f"{self.prefix}error"] = f"AI processing timed out after {timeout} seconds"
-                return search_results
-            
-            if result_container["error"]:
-                print(f"QA processing error: {result_container['error']}")
-                if hasattr(st, 'session_state'):
-                    st.session_state[f"{self.prefix}error"] = f"AI processing error: {result_container['error']}"
-                return search_results
+            # Add user preferences with contents and custom prompt if available
+            if hasattr(self, 'user_preferences') and self.user_preferences:
+                prefs_file = self.user_preferences.preferences_file
+                try:
+                    self.user_preferences.preferences = _cached_saved_preferences(
+                        str(prefs_file), prefs_file.stat().st_mtime, self.user_preferences
+                    )
+                except OSError:
+                    pass
+                user_preferences_str = self.user_preferences.get_prompt_customization()
+                if user_preferences_str:
+                    preferences_applied = True
+                    print(f"Applying user preferences to AI response: {user_preferences_str}")
+            
+            question = query + (f"\n\nPlease apply these preferences: {user_preferences_str}" if user_preferences_str else "")
+            
+            docs_for_qa = [{
+                'text': result.get('content', ''),
+                'title': result.get('title', 'Untitled'),
+                'source': result.get('source', 'Unknown'),
+                'score': result.get('score', 1.0)
+            } for result in search_results or []]
+            
+            cache_key = (
+                " ".join(query.lower().split()),
+                round(relevance_threshold, 2),
+                user_preferences_str,
+                tuple((doc['title'], doc['source'], doc['text']) for doc in docs_for_qa)
+            )
+            qa_cache, qa_cache_lock = _get_qa_cache()
+            with qa_cache_lock:
+                answer_result = qa_cache.get(cache_key)
+                if answer_result is not None:
+                    qa_cache.move_to_end(cache_key)
+            
+            if answer_result is None:
+                answer_result = self._run_qa(question, docs_for_qa, relevance_threshold)
+                if answer_result:
+                    with qa_cache_lock:
+                        qa_cache[cache_key] = answer_result
+                        if len(qa_cache) > QA_CACHE_SIZE:
+                            qa_cache.popitem(last=False)
+            else:
+                print("Using cached QA answer")
             
-            if result_container["answer"]:
-                st.session_state[f"{self.prefix}preferences_applied"] = result_container["preferences_applied"]
+            if answer_result:
+                self.ss["preferences_applied"] = preferences_applied
                 
                 return {
-                    "answer": result_container["answer"]["answer"],
-                    "sources": result_container["answer"]["sources"],
+                    "answer": answer_result["answer"],
+                    "sources": answer_result["sources"],
                     "search_results": search_results,
-                    "preferences_applied": result_container["preferences_applied"]
+                    "preferences_applied": preferences_applied
                 }
             
             return search_results
         except Exception as e:
             print(f"Exception during QA processing: {str(e)}")
             if hasattr(st, 'session_state'):
-                st.session_state[f"{self.prefix}error"] = f"Exception during AI processing: {str(e)}"
+                self.ss["error"] = f"Exception during AI processing: {str(e)}"
             return search_results
             
     def _init_session_state(self):
         """Initialize session state variables."""
-        prefix = self.prefix
-        
-        if f"{prefix}query" not in st.session_state:
-            st.session_state[f"{prefix}query"] = ""
-        
-        if f"{prefix}search_triggered" not in st.session_state:
-            st.session_state[f"{prefix}search_triggered"] = False
+        for key, value in self._SESSION_DEFAULTS.items():
+            self.ss.setdefault(key, value)
         
-        if f"{prefix}results" not in st.session_state:
-            st.session_state[f"{prefix}results"] = None
-            
-        if f"{prefix}error" not in st.session_state:
-            st.session_state[f"{prefix}error"] = None
-            
-        if f"{prefix}preferences_applied" not in st.session_state:
-            st.session_state[f"{prefix}preferences_applied"] = False
-            
-        if f"{prefix}last_updated" not in st.session_state:
-            st.session_state[f"{prefix}last_updated"] = None
-            
-        if f"{prefix}api_key_status" not in st.session_state:
-            st.session_state[f"{prefix}api_key_status"] = "unknown"
-            
-        if f"{prefix}use_qa" not in st.session_state:
-            st.session_state[f"{prefix}use_qa"] = True
-            
-        if f"{prefix}relevance_threshold" not in st.session_state:
-            st.session_state[f"{prefix}relevance_threshold"] = 0.4
-            
-        if f"{prefix}qa_timeout" not in st.session_state:
-            st.session_state[f"{prefix}qa_timeout"] = 30
-            
-        if f"{prefix}result_limit" not in st.session_state:
-            st.session_state[f"{prefix}result_limit"] = 10
-            
-        if f"{prefix}show_debug" not in st.session_state:
-            st.session_state[f"{prefix}show_debug"] = False
-            
-        if f"{prefix}viewing_content" not in st.session_state:
-            st.session_state[f"{prefix}viewing_content"] = None
-            
-        if f"{prefix}viewing_source" not in st.session_state:
-            st.session_state[f"{prefix}viewing_source"] = None
-            
-        if f"{prefix}selected_category" not in st.session_state:
-            st.session_state[f"{prefix}selected_category"] = None
-            
-        if f"{prefix}selected_topic" not in st.session_state:
-            st.session_state[f"{self.prefix}selected_topic"] = None
-            
-        if f"{prefix}show_filters" not in st.session_state:
-            st.session_state[f"{prefix}show_filters"] = False
+        if self.init_error:
+            self.ss["error"] = self.init_error
+        elif self.kb:
+            self.ss["kb_stats"] = _cached_kb_stats(KB_MANAGER_DB_PATH, self.kb)
 
     def _display_category_topic_filters(self):
         """Display category and topic filters for the search."""
@@ -512,7 +343,7 @@ class KnowledgeBaseSearchApp:
         
         show_filters = st.checkbox(
             "Show Category/Topic Filters", 
-            value=st.session_state.get(f"{self.prefix}show_filters", False),
+            value=self.ss.get("show_filters", False),
             key=f"{self.prefix}show_filters"
         )
         
@@ -524,66 +355,59 @@ class KnowledgeBaseSearchApp:
                 st.markdown("### Filter by Category and Topic")
                 
                 try:
-                    categories = []
+                    category_options = []
                     try:
                         if self.db_manager and hasattr(self.db_manager, 'get_categories'):
-                            categories = self.db_manager.get_categories()
+                            category_options = cached_filter_categories(KB_MANAGER_DB_PATH, self.db_manager)
                     except Exception as e:
                         st.warning(f"Error loading categories: {str(e)}")
                     
-                    if not categories.empty:
-                        category_options = [("", "All Categories")] + [(cat["id"], cat["name"]) for _, cat in categories.iterrows()]
-                        selected_category = st.session_state.get(f"{self.prefix}selected_category", "")
+                    if len(category_options) > 1:
+                        selected_category = self.ss.get("selected_category", "")
+                        category_index = {id: i for i, (id, _) in enumerate(category_options)}
                         
-                        category_name_map = {id: name for id, name in category_options}
-                        
-                        selected_category_name = category_name_map.get(selected_category, "All Categories")
-                        selected_index = next((i for i, (id, _) in enumerate(category_options) if id == selected_category), 0)
-                        
-                        new_category = st.selectbox(
+                        new_category_index = st.selectbox(
                             "Category",
-                            options=[name for _, name in category_options],
-                            index=selected_index,
+                            options=range(len(category_options)),
+                            format_func=lambda i: category_options[i][1],
+                            index=category_index.get(selected_category, 0),
                             key=f"{self.prefix}category_selector"
                         )
                         
-                        new_category_id = next((id for id, name in category_options if name == new_category), "")
+                        new_category_id = category_options[new_category_index][0]
                         if new_category_id != selected_category:
-                            st.session_state[f"{self.prefix}selected_category"] = new_category_id
-                            st.session_state[f"{self.prefix}selected_topic"] = None
+                            self.ss["selected_category"] = new_category_id
+                            self.ss["selected_topic"] = None
                             st.rerun()
                         
-                        category_id = st.session_state.get(f"{self.prefix}selected_category")
+                        category_id = self.ss.get("selected_category")
                         
                         if category_id:
-                            topics = []
+                            topic_options = []
                             try:
                                 if self.db_manager and hasattr(self.db_manager, 'get_topics'):
-                                    topics = self.db_manager.get_topics(category_id)
+                                    topic_options = cached_filter_topics(KB_MANAGER_DB_PATH, category_id, self.db_manager)
                             except Exception as e:
                                 st.warning(f"Error loading topics: {str(e)}")
                             
-                            if not topics.empty:
-                                topic_options = [("", "All Topics")] + [(topic["id"], topic["name"]) for _, topic in topics.iterrows()]
-                                selected_topic = st.session_state.get(f"{self.prefix}selected_topic", "")
+                            if len(topic_options) > 1:
+                                selected_topic = self.ss.get("selected_topic", "")
+                                topic_index = {id: i for i, (id, _) in enumerate(topic_options)}
                                 
-                                topic_name_map = {id: name for id, name in topic_options}
-                                
-                                selected_topic_name = topic_name_map.get(selected_topic, "All Topics")
-                                selected_index = next((i for i, (id, _) in enumerate(topic_options) if id == selected_topic), 0)
-                                new_topic = st.selectbox(
+                                new_topic_index = st.selectbox(
                                     "Topic",
-                                    options=[name for _, name in topic_options],
-                                    index=selected_index,
+                                    options=range(len(topic_options)),
+                                    format_func=lambda i: topic_options[i][1],
+                                    index=topic_index.get(selected_topic, 0),
                                     key=f"{self.prefix}topic_selector"
                                 )
                                 
-                                new_topic_id = next((id for id, name in topic_options if name == new_topic), "")
+                                new_topic_id = topic_options[new_topic_index][0]
                                 
                                 if new_topic_id != selected_topic:
-                                    st.session_state[f"{self.prefix}selected_topic"] = new_topic_id
+                                    self.ss["selected_topic"] = new_topic_id
                                 
-                                topic_id = st.session_state.get(f"{self.prefix}selected_topic")
+                                topic_id = self.ss.get("selected_topic")
                     else:
                         st.info("No categories available. Add categories and topics in the Knowledge Base Manager.")
                 except Exception as e:
@@ -595,7 +419,7 @@ class KnowledgeBaseSearchApp:
 
     def _get_relevance_threshold(self):
         """Get the relevance threshold from session state."""
-        return st.session_state.get(f"{self.prefix}relevance_threshold", 0.4)
+        return self.ss.get("relevance_threshold", 0.4)
     
     def _display_settings_in_expander(self):
         """Display search settings in an expander in the main content area."""
@@ -620,7 +444,7 @@ class KnowledgeBaseSearchApp:
                     "Relevance Threshold", 
                     min_value=0.1, 
                     max_value=0.9, 
-                    value=st.session_state.get(f"{self.prefix}relevance_threshold", 0.4),
+                    value=self.ss.get("relevance_threshold", 0.4),
                     step=0.05,
                     key=f"{self.prefix}relevance_threshold_slider",
                     help="Lower values are more strict, requiring closer matches. Higher values include more diverse results."
@@ -631,64 +455,53 @@ class KnowledgeBaseSearchApp:
                     "Max Search Results", 
                     min_value=1, 
                     max_value=25, 
-                    value=st.session_state.get(f"{self.prefix}result_limit", 10),
+                    value=self.ss.get("result_limit", 10),
                     step=1,
                     key=f"{self.prefix}result_limit_slider",
                     help="Maximum number of search results to retrieve."
                 )
                 show_debug = st.checkbox(
                     "Show Debug Information", 
-                    value=st.session_state.get(f"{self.prefix}show_debug", False),
+                    value=self.ss.get("show_debug", False),
                     key=f"{self.prefix}show_debug_checkbox"
                 )
     
     def _handle_enter_key(self):
         """Handle Enter key press in the search input."""
-        current_query = st.session_state.get(f"{self.prefix}query_input", "")
-        if current_query and current_query != st.session_state.get(f"{self.prefix}query", ""):
-            st.session_state[f"{self.prefix}query"] = current_query
-            st.session_state[f"{self.prefix}search_triggered"] = True
+        current_query = self.ss.get("query_input", "")
+        if current_query and current_query != self.ss.get("query", ""):
+            self.ss["query"] = current_query
+            self.ss["search_triggered"] = True
     
     def _display_debug_info(self, query, search_results, answer=None, error=None):
         """Display debug information about the search and QA process."""
         with st.expander("Debug Information", expanded=False):
             st.markdown("### Debug Information")
             
+            now = datetime.now()
             debug_info = {
                 "query": query,
-                "timestamp": str(datetime.now()),
+                "timestamp": now.isoformat(timespec="seconds"),
                 "relevance_threshold": self._get_relevance_threshold(),
-                "max_results": st.session_state.get(f"{self.prefix}result_limit", 10),
-                "use_qa": st.session_state.get(f"{self.prefix}use_qa", True),
-                "qa_timeout": st.session_state.get(f"{self.prefix}qa_timeout", 30),
+                "max_results": self.ss.get("result_limit", 10),
+                "use_qa": self.ss.get("use_qa", True),
+                "qa_timeout": self.ss.get("qa_timeout", 30),
                 "error": error
             }
             
             if search_results:
-                if isinstance(search_results, dict) and "search_results" in search_results:
-                    result_info = []
-                    for i, result in enumerate(search_results.get("search_results", [])):
-                        result_info.append({
-                            "index": i,
-                            "title": result.get("title", "Untitled"),
-                            "score": result.get("score", 0),
-                            "source": result.get("source", "Unknown"),
-                            "content_length": len(result.get("content", "")) if "content" in result else 0
-                        })
-                    debug_info["search_results"] = result_info
-                    debug_info["answer_length"] = len(search_results.get("answer", "")) if "answer" in search_results else 0
-                    debug_info["sources_count"] = len(search_results.get("sources", [])) if "sources" in search_results else 0
-                else:
-                    result_info = []
-                    for i, result in enumerate(search_results):
-                        result_info.append({
-                            "index": i,
-                            "title": result.get("title", "Untitled"),
-                            "score": result.get("score", 0),
-                            "source": result.get("source", "Unknown"),
-                            "content_length": len(result.get("content", "")) if "content" in result else 0
-                        })
-                    debug_info["search_results"] = result_info
+                is_qa_result = isinstance(search_results, dict) and "search_results" in search_results
+                result_list = search_results.get("search_results", []) if is_qa_result else search_results
+                debug_info["search_results"] = [{
+                    "index": i,
+                    "title": result.get("title", "Untitled"),
+                    "score": result.get("score", 0),
+                    "source": result.get("source", "Unknown"),
+                    "content_length": len(result.get("content", ""))
+                } for i, result in enumerate(result_list)]
+                if is_qa_result:
+                    debug_info["answer_length"] = len(search_results.get("answer", ""))
+                    debug_info["sources_count"] = len(search_results.get("sources", []))
             
             debug_json = json.dumps(debug_info, indent=2)
             st.code(debug_json, language="json")
@@ -696,12 +509,13 @@ class KnowledgeBaseSearchApp:
             st.download_button(
                 label="Download Debug Info",
                 data=debug_json,
-                file_name=f"kb_search_debug_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                file_name=f"kb_search_debug_{now.strftime('%Y%m%d_%H%M%S')}.json",
                 mime="application/json",
             )
     
     def render(self):
         """Render the Knowledge Base Search application."""
+        self._apply_custom_css()
         st.title("Knowledge Base Search")
         st.markdown("Search across your knowledge base for relevant information. Get AI-powered answers to your questions.")
         
@@ -712,7 +526,7 @@ class KnowledgeBaseSearchApp:
         with search_col1:
             query = st.text_input(
                 "Search Query", 
-                value=st.session_state.get(f"{self.prefix}query", ""),
+                value=self.ss.get("query", ""),
                 key=f"{self.prefix}query_input",
                 placeholder="Enter your search query or question...",
                 on_change=self._handle_enter_key
@@ -721,25 +535,25 @@ class KnowledgeBaseSearchApp:
         with search_col2:
             search_button = st.button("Search", use_container_width=True)
             
-        if search_button or st.session_state.get(f"{self.prefix}search_triggered", False):
-            st.session_state[f"{self.prefix}search_triggered"] = False
+        if search_button or self.ss.get("search_triggered", False):
+            self.ss["search_triggered"] = False
             
             if query:
-                st.session_state[f"{self.prefix}query"] = query
-                st.session_state[f"{self.prefix}error"] = None
-                st.session_state[f"{self.prefix}results"] = None
+                self.ss["query"] = query
+                self.ss["error"] = None
+                self.ss["results"] = None
                 with st.spinner("Searching knowledge base..."):
                     results = self._search_knowledge_base(
                         query,
                         category_id=category_id,
                         topic_id=topic_id,
-                        limit=st.session_state.get(f"{self.prefix}result_limit", 10)
+                        limit=self.ss.get("result_limit", 10)
                     )
-                    st.session_state[f"{self.prefix}results"] = results
-                    st.session_state[f"{self.prefix}last_updated"] = datetime.now()
+                    self.ss["results"] = results
+                    self.ss["last_updated"] = datetime.now()
                 st.rerun()
         
-        results = st.session_state.get(f"{self.prefix}results")
+        results = self.ss.get("results")
         if results:
             if isinstance(results, dict) and "answer" in results:
                 st.markdown("### AI-Generated Answer")
@@ -771,18 +585,18 @@ class KnowledgeBaseSearchApp:
                 for i, result in enumerate(result_list):
                     self._display_result_item(result)
         
-        if st.session_state.get(f"{self.prefix}show_debug", False):
+        if self.ss.get("show_debug", False):
             self._display_debug_info(
-                query=st.session_state.get(f"{self.prefix}query", ""),
+                query=self.ss.get("query", ""),
                 search_results=results,
                 answer=results.get('answer', None) if isinstance(results, dict) else None,
-                error=st.session_state.get(f"{self.prefix}error", None)
+                error=self.ss.get("error", None)
             )
             
         st.markdown("---")
         st.markdown(
             "<div class='footer'>Knowledge Base Search | Powered by LanceDB and OpenAI | "
-            f"Last updated: {st.session_state.get(f'{self.prefix}last_updated', 'Never')}</div>",
+            f"Last updated: {self.ss.get('last_updated', 'Never')}</div>",
             unsafe_allow_html=True
         )
         
@@ -794,7 +608,7 @@ class KnowledgeBaseSearchApp:
             return []
         
         if limit is None:
-            limit = st.session_state.get(f"{self.prefix}result_limit", 10)
+            limit = self.ss.get("result_limit", 10)
         
         print(f"Starting search for query: {query} with limit: {limit}")
         
@@ -803,7 +617,7 @@ class KnowledgeBaseSearchApp:
             "category_id": category_id,
             "topic_id": topic_id,
             "limit": limit,
-            "timestamp": str(datetime.now()),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
             "steps": []
         }
         
@@ -925,7 +739,7 @@ class KnowledgeBaseSearchApp:
             })
             return []
         
-        if st.session_state.get(f"{self.prefix}use_qa", True) and hasattr(self, 'qa_processor') and self.qa_processor is not None:
+        if self.ss.get("use_qa", True) and hasattr(self, 'qa_processor') and self.qa_processor is not None:
             processed_results = self._process_with_qa(query, search_results)
             return processed_results
         
@@ -957,14 +771,14 @@ class KnowledgeBaseSearchApp:
         
         button_key = f"view_{result.get('id', hash(str(result.get('content', ''))[:50]))}"
         if st.button(f"View Full Content", key=button_key):
-            st.session_state[f"{self.prefix}viewing_content"] = result
+            self.ss["viewing_content"] = result
         
-        viewing_content = st.session_state.get(f"{self.prefix}viewing_content")
+        viewing_content = self.ss.get("viewing_content")
         if viewing_content and viewing_content.get('id', hash(str(viewing_content.get('content', '')))) == result.get('id', hash(str(result.get('content', '')))):
             with st.expander("Full Content", expanded=True):
                 st.markdown(viewing_content.get('content', 'No content available.'))
                 if st.button("Hide Content", key=f"hide_{button_key}"):
-                    st.session_state[f"{self.prefix}viewing_content"] = None
+                    self.ss["viewing_content"] = None
                     
     def _format_relevance_score(self, normalized_score):
         """Format relevance score with appropriate styling."""
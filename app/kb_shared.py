@@ -0,0 +1,34 @@
+import streamlit as st
+import sys
+from pathlib import Path
+
+parent_dir = str(Path(__file__).resolve().parent.parent)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+from tools.lancedb_manager import LanceDBManager
+
+# Process-wide resources shared by the app pages; anything cached here is shared
+# by every session, so it must stay read-only once built
+
+@st.cache_resource
+def get_db_manager(lancedb_path):
+    """Open the LanceDB manager for a database path once per process."""
+    return LanceDBManager(lancedb_path)
+
+# Category and topic options for the search page filters; the KB manager clears them on writes
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_filter_categories(db_path, _db_manager):
+    """(id, name) options for the category filter"""
+    categories = _db_manager.get_categories()
+    return [("", "All Categories"), *zip(categories["id"], categories["name"])]
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_filter_topics(db_path, category_id, _db_manager):
+    """(id, name) options for the topic filter of one category"""
+    topics = _db_manager.get_topics(category_id)
+    return [("", "All Topics"), *zip(topics["id"], topics["name"])]
+
+def clear_category_caches():
+    """Drop the cached filter categories and topics; called after any category or topic write"""
+    cached_filter_categories.clear()
+    cached_filter_topics.clear()
@@ -13,7 +13,7 @@ from tools.note_processor import NoteProcessor
 from tools.prompt_builder import PromptBuilder
 from tools.user_preferences import UserPreferences
 from tools.knowledge_base import KnowledgeBase
-from tools.lancedb_manager import LanceDBManager
+from kb_shared import get_db_manager
 
 class NoteProcessorApp:
     def __init__(self, notes_folder=None, processor_class=None, lancedb_path='data/lancedb'):
@@ -38,7 +38,7 @@ class NoteProcessorApp:
             self.note_processor = NoteProcessor(preferences=self.user_preferences)
             
         self.prompt_builder = PromptBuilder()
-        self.db_manager = LanceDBManager(db_path=self.lancedb_path)
+        self.db_manager = get_db_manager(self.lancedb_path)
             
         self._init_session_state()
         
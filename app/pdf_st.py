@@ -11,7 +11,7 @@ parent_dir = Path(__file__).resolve().parent.parent
 sys.path.append(str(parent_dir))
 from tools.pdf_processor import PDFProcessor
 from tools.knowledge_base import KnowledgeBase
-from tools.lancedb_manager import LanceDBManager
+from kb_shared import get_db_manager
 from utils.file_remover import FileRemover
 
 class PDFConverterApp:
@@ -38,7 +38,7 @@ class PDFConverterApp:
         else:
             self.pdf_processor = None
         
-        self.db_manager = LanceDBManager(db_path=self.lancedb_path)
+        self.db_manager = get_db_manager(self.lancedb_path)
         self._init_session_state()
         
     def _init_session_state(self):
@@ -64,6 +64,11 @@ class PDFConverterApp:
     
     def render(self):
         """Render the PDF converter interface"""
+        self.render_main()
+        self._render_sidebar()
+    
+    def render_main(self):
+        """Render the upload and results panel without the sidebar"""
         st.markdown('<div class="upload-container">', unsafe_allow_html=True)
         st.write("Upload a PDF file to convert it to markdown format:")
         uploaded_file = st.file_uploader("Choose a PDF file", type=["pdf"], key="pdf_uploader")
@@ -83,8 +88,6 @@ class PDFConverterApp:
 
         if st.session_state.markdown_text is not None:
             self._display_results()
-            
-        self._render_sidebar()
     
     def _process_pdf(self, uploaded_file):
         """Process the uploaded PDF file"""
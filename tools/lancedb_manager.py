@@ -54,9 +54,10 @@ class LanceDBManager:
         "entries": ["vector"]
     }
     
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, db=None):
         self.db_path = db_path
-        self.db = lancedb.connect(db_path)
+        # Reuse an already open connection to db_path when the caller has one
+        self.db = db if db is not None else lancedb.connect(db_path)
         
         logger.info("Initializing OpenAI embeddings for LanceDBManager...")
         start_time = time.time()
@@ -226,10 +227,17 @@ class LanceDBManager:
         categories_table.add(category_data)
         return category_id
     
-    def get_categories(self):
-        """Get all categories from the categories table."""
-        table = self.db.open_table("categories")
-        return table.to_pandas()
+    def _read_table(self, table_name: str, where: Optional[str] = None, columns: Optional[List[str]] = None,
+                    as_arrow: bool = False):
+        """Read rows from a table as a DataFrame or an Arrow table, optionally filtered and projected."""
+        # Scan the dataset directly: no row cap (the query builder defaults to 10) and no count_rows() round-trip
+        dataset = self.db.open_table(table_name).to_lance()
+        table = dataset.to_table(columns=columns, filter=where)
+        return table if as_arrow else table.to_pandas()
+    
+    def get_categories(self, columns: Optional[List[str]] = None):
+        """Get all categories from the categories table, optionally projected to columns."""
+        return self._read_table("categories", columns=columns)
     
     def get_category(self, category_id: str):
         """Get a single category from the categories table by category_id."""
@@ -316,11 +324,10 @@ class LanceDBManager:
         topic_table.add(topic_data)
         return topic_id
 
-    def get_topics(self, category_id: Optional[str] = None):
-        """Get all topics, optionally filtered by category_id."""
-        if category_id: 
-            return self.db.open_table("topics").search().where(f"category_id = '{category_id}'").to_pandas()
-        return self.db.open_table("topics").to_pandas()
+    def get_topics(self, category_id: Optional[str] = None, columns: Optional[List[str]] = None):
+        """Get all topics, optionally filtered by category_id and projected to columns."""
+        where = f"category_id = '{category_id}'" if category_id else None
+        return self._read_table("topics", where, columns)
     
     def get_topic(self, topic_id: str):
         """Get a single topic from the topics table given a topic_id."""
@@ -435,11 +442,10 @@ class LanceDBManager:
         
         return entry_id
     
-    def get_entries(self, topic_id: Optional[str] = None):
-        """Get all entries, optionally filtered by topic_id."""
-        if topic_id:
-            return self.db.open_table("entries").search().where(f"topic_id = '{topic_id}'").to_pandas()
-        return self.db.open_table("entries").to_pandas()
+    def get_entries(self, topic_id: Optional[str] = None, columns: Optional[List[str]] = None):
+        """Get all entries, optionally filtered by topic_id and projected to columns."""
+        where = f"topic_id = '{topic_id}'" if topic_id else None
+        return self._read_table("entries", where, columns)
     
     def get_entry(self, entry_id: str):
         """Get a single entry from the entries table given an entry_id."""
@@ -570,19 +576,12 @@ class LanceDBManager:
             results = table.search(query).limit(limit).to_pandas()
             logger.info(f"Full-text search completed in {time.time() - start_time:.2f} seconds")
             
-            formatted_results = []
-            for _, row in results.iterrows():
-                result = row.to_dict()
-                
+            formatted_results = results.drop(columns=["vector"], errors="ignore").to_dict('records')
+            for result in formatted_results:
                 if "_score" in result:
                     result["score"] = float(result["_score"])
                 else:
                     result["score"] = 1.0  # Default score 
-                
-                if "vector" in result:
-                    del result["vector"]
-                
-                formatted_results.append(result)
             
             return formatted_results
             
@@ -699,31 +698,23 @@ class LanceDBManager:
             logger.error(traceback.format_exc())
             return []
     
-    def get_full_hierarchy(self):
-        """Get the full hierarchy of categories, topics, and entries."""
-        categories = self.get_categories()
-        result = []
-        
-        for _, category in categories.iterrows():
-            cat_dict = category.to_dict()
-            topics = self.get_topics(category["id"])
-            cat_dict["topics"] = []
-            
-            for _, topic in topics.iterrows():
-                topic_dict = topic.to_dict()
-                entries = self.get_entries(topic["id"])
-                entry_list = []
-                for _, entry in entries.iterrows():
-                    entry_dict = entry.to_dict()
-                    if "tags" not in entry_dict and "tags_json" in entry_dict:
-                        entry_dict["tags"] = json.loads(entry_dict["tags_json"])
-                    entry_list.append(entry_dict)
-
-                topic_dict["entries"] = entry_list
-                cat_dict["topics"].append(topic_dict)
-            result.append(cat_dict)
-            
-        return {"categories": result}
+    def get_hierarchy_flat(self) -> pd.DataFrame:
+        """Get categories, topics and entries as one flat frame, reading each table once."""
+        def read(table_name, columns, names, order):
+            table = self._read_table(table_name, columns=columns, as_arrow=True).rename_columns(names)
+            return table.append_column(order, pa.array(range(table.num_rows), type=pa.int64()))
+        
+        categories = read("categories", ["id", "name"], ["category_id", "category_name"], "category_order")
+        topics = read("topics", ["id", "category_id", "name"], ["topic_id", "category_id", "topic_name"], "topic_order")
+        entries = read("entries", ["id", "topic_id", "title", "created_at", "tags_json"],
+                       ["entry_id", "topic_id", "title", "created_at", "tags_json"], "entry_order")
+        # Join in Arrow and convert only the result; left joins keep categories without topics
+        # and topics without entries, and Arrow joins do not keep row order, so restore table order
+        flat = categories.join(topics, "category_id", join_type="left outer").join(
+            entries, "topic_id", join_type="left outer")
+        order = ["category_order", "topic_order", "entry_order"]
+        flat = flat.sort_by([(name, "ascending") for name in order]).drop_columns(order)
+        return flat.to_pandas()
 
     def check_indices(self, table_name: str) -> Dict[str, List[str]]:
         """Check which indices exist for a given table.